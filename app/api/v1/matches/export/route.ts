@@ -3,13 +3,45 @@
 import { NextResponse } from "next/server";
 
 import { handleApiRequest } from "@/lib/api/handle-request";
-import { getMatches } from "@/lib/services/matches";
+import { iterMatches } from "@/lib/services/matches";
 
 // [>]: Practical limit for export operations.
 const EXPORT_LIMIT = 100_000;
 
 // [>]: GET /api/v1/matches/export - export all matches as JSON.
+// Streams a JSON array page by page so the full export never sits in memory.
 export const GET = handleApiRequest(async () => {
-  const matches = await getMatches({ limit: EXPORT_LIMIT });
-  return NextResponse.json(matches);
+  const matches = iterMatches({ limit: EXPORT_LIMIT });
+  const encoder = new TextEncoder();
+
+  // [>]: Read the first match before streaming so errors on the first page
+  // still go through handleApiRequest as a normal error response.
+  let next = await matches.next();
+  let prefix = "[";
+
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      if (next.done) {
+        controller.enqueue(encoder.encode(prefix === "[" ? "[]" : "]"));
+        controller.close();
+        return;
+      }
+
+      controller.enqueue(encoder.encode(prefix + JSON.stringify(next.value)));
+      prefix = ",";
+
+      try {
+        next = await matches.next();
+      } catch (error) {
+        controller.error(error);
+      }
+    },
+    async cancel() {
+      await matches.return(undefined);
+    },
+  });
+
+  return new NextResponse(body, {
+    headers: { "Content-Type": "application/json" },
+  });
 });
@@ -2,24 +2,47 @@
 
 import { NextRequest, NextResponse } from "next/server";
 
-import { handleApiRequest, getNumericParam } from "@/lib/api/handle-request";
+import {
+  handleApiRequest,
+  getNumericParam,
+  getCursorParam,
+} from "@/lib/api/handle-request";
 import {
   getAllPlayersWithStats,
+  getPlayersPage,
   createNewPlayer,
 } from "@/lib/services/players";
 import { PlayerCreateSchema } from "@/lib/types/schemas/player";
 
-// [>]: GET /api/v1/players - list all players with stats.
+// [>]: GET /api/v1/players - list players with stats.
+// Without `after`: every player ordered by ELO, sliced only when skip/limit
+// are given. With `after`: keyset page ordered by player_id; pass the
+// X-Next-Cursor header value as the next `after` (start with after=0).
 export const GET = handleApiRequest(async (request: NextRequest) => {
   const { searchParams } = new URL(request.url);
-  const limit = getNumericParam(searchParams, "limit", 50);
-  const skip = getNumericParam(searchParams, "skip", 0);
+  const after = getCursorParam(searchParams, "after");
+
+  if (after === undefined) {
+    const players = await getAllPlayersWithStats();
+    if (!searchParams.has("skip") && !searchParams.has("limit")) {
+      return NextResponse.json(players);
+    }
 
-  const players = await getAllPlayersWithStats();
+    // [>]: Apply pagination in-memory (service returns all players).
+    const limit = getNumericParam(searchParams, "limit", 50);
+    const skip = getNumericParam(searchParams, "skip", 0);
+    return NextResponse.json(players.slice(skip, skip + limit));
+  }
+
+  const limit = getNumericParam(searchParams, "limit", 50);
+  const { players, nextCursor } = await getPlayersPage({ limit, after });
 
-  // [>]: Apply pagination in-memory (service returns all players).
-  const paginated = players.slice(skip, skip + limit);
-  return NextResponse.json(paginated);
+  // [>]: Body stays a plain array; the cursor travels in a header.
+  const response = NextResponse.json(players);
+  if (nextCursor !== null) {
+    response.headers.set("X-Next-Cursor", String(nextCursor));
+  }
+  return response;
 });
 
 // [>]: POST /api/v1/players - create new player.
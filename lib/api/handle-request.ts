@@ -49,6 +49,21 @@ export function getBooleanParam(
   return value !== null ? value === "true" : undefined;
 }
 
+// [>]: Parse optional keyset cursor (a non-negative integer ID).
+// Throws ValidationError if present but invalid.
+export function getCursorParam(
+  searchParams: URLSearchParams,
+  key: string,
+): number | undefined {
+  const value = searchParams.get(key);
+  if (value === null) return undefined;
+  const parsed = Number(value);
+  if (value.trim() === "" || !Number.isInteger(parsed) || parsed < 0) {
+    throw new ValidationError(`Invalid ${key}: must be a non-negative integer`);
+  }
+  return parsed;
+}
+
 // [>]: Format Zod validation errors into readable messages.
 function formatZodError(error: ZodError): string {
   const messages = error.errors.map((e) => {
@@ -0,0 +1,63 @@
+// [>]: In-process TTL cache for hot read paths.
+// [!]: Entries live in one server instance's memory. Writes handled by another
+// instance are only seen once the entry expires, so keep TTLs short and
+// invalidate explicitly on every local write.
+
+export interface TtlCacheOptions {
+  ttlMs: number;
+  maxEntries?: number;
+}
+
+const DEFAULT_MAX_ENTRIES = 1000;
+
+interface CacheEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Map-backed cache whose entries expire after a fixed time-to-live.
+ *
+ * When full, the oldest inserted entry is evicted to make room.
+ */
+export class TtlCache<K, V> {
+  private readonly entries = new Map<K, CacheEntry<V>>();
+  private readonly ttlMs: number;
+  private readonly maxEntries: number;
+
+  constructor({ ttlMs, maxEntries = DEFAULT_MAX_ENTRIES }: TtlCacheOptions) {
+    this.ttlMs = ttlMs;
+    this.maxEntries = maxEntries;
+  }
+
+  // [>]: Returns undefined for missing or expired keys.
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    return entry.value;
+  }
+
+  set(key: K, value: V): void {
+    // [>]: Re-insert so Map order stays oldest-first for eviction.
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
@@ -27,6 +27,15 @@ export function getSupabaseClient(): SupabaseClient {
     );
   }
 
-  supabase = createClient(url, key);
+  // [>]: Stateless server client: no session storage or token refresh timer.
+  // Requests reuse Node's keep-alive fetch connections; PostgREST pools the
+  // database connections on the server side.
+  supabase = createClient(url, key, {
+    auth: {
+      persistSession: false,
+      autoRefreshToken: false,
+      detectSessionInUrl: false,
+    },
+  });
   return supabase;
 }
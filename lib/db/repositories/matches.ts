@@ -41,6 +41,19 @@ interface MatchWithTeamsRow extends MatchDbRow {
   > | null;
 }
 
+// [>]: Precomputed ELO change for one player or team, passed to record_match.
+interface PlayerEloChangeInput {
+  player_id: number;
+  old_elo: number;
+  new_elo: number;
+}
+
+interface TeamEloChangeInput {
+  team_id: number;
+  old_elo: number;
+  new_elo: number;
+}
+
 // [>]: Query options for match filtering.
 interface MatchQueryOptions {
   limit?: number;
@@ -50,43 +63,41 @@ interface MatchQueryOptions {
   endDate?: string;
 }
 
-// [>]: Create a new match record. Returns the match_id.
-// Does NOT update ELOs - that is the service layer's responsibility.
-async function createMatchByTeamIdsImpl(
-  winnerTeamId: number,
-  loserTeamId: number,
-  playedAt: string,
-  isFanny: boolean = false,
-  notes?: string,
+// [>]: Record a match with its ELO changes atomically. Returns the match_id.
+// Inserts the match, updates player and team ratings (and team last_match_at)
+// and writes both history tables in a single database transaction.
+async function recordMatchWithEloImpl(
+  match: {
+    winner_team_id: number;
+    loser_team_id: number;
+    played_at: string;
+    is_fanny: boolean;
+    notes?: string | null;
+  },
+  playerChanges: PlayerEloChangeInput[],
+  teamChanges: TeamEloChangeInput[],
 ): Promise<number> {
   const client = getSupabaseClient();
 
-  const matchData: Record<string, unknown> = {
-    winner_team_id: winnerTeamId,
-    loser_team_id: loserTeamId,
-    played_at: playedAt,
-    is_fanny: isFanny,
-  };
-
-  if (notes) {
-    matchData.notes = notes;
-  }
-
-  const { data, error } = await client
-    .from("matches")
-    .insert(matchData)
-    .select("match_id")
-    .single();
+  const { data, error } = await client.rpc("record_match", {
+    p_winner_team_id: match.winner_team_id,
+    p_loser_team_id: match.loser_team_id,
+    p_played_at: match.played_at,
+    p_is_fanny: match.is_fanny,
+    p_notes: match.notes || null,
+    p_player_changes: playerChanges,
+    p_team_changes: teamChanges,
+  });
 
   if (error) {
-    throw new MatchCreationError(`Failed to create match: ${error.message}`);
+    throw new MatchCreationError(`Failed to record match: ${error.message}`);
   }
 
-  if (!data?.match_id) {
-    throw new MatchCreationError("Failed to create match: no ID returned");
+  if (!data) {
+    throw new MatchCreationError("Failed to record match: no ID returned");
   }
 
-  return data.match_id;
+  return data;
 }
 
 // [>]: Lookup match by ID. Throws MatchNotFoundError if not found.
@@ -112,6 +123,31 @@ async function getMatchByIdImpl(matchId: number): Promise<MatchDbRow> {
   return data;
 }
 
+// [>]: Lookup match by ID with both teams and its ELO changes in one RPC.
+// elo_changes is keyed by player ID, or by team ID when byTeam is true.
+// Throws MatchNotFoundError if not found.
+async function getMatchWithEloByIdImpl(
+  matchId: number,
+  byTeam: boolean = false,
+): Promise<MatchWithTeamsRow> {
+  const client = getSupabaseClient();
+
+  const { data, error } = await client.rpc("get_match_with_elo", {
+    p_match_id: matchId,
+    p_by_team: byTeam,
+  });
+
+  if (error) {
+    throw new MatchOperationError(`Database error: ${error.message}`);
+  }
+
+  if (!data) {
+    throw new MatchNotFoundError(matchId);
+  }
+
+  return data;
+}
+
 // [>]: Get all matches with pagination and optional filters (uses RPC for joined data).
 async function getAllMatchesImpl(
   options: MatchQueryOptions = {},
@@ -207,12 +243,19 @@ async function deleteMatchByIdImpl(matchId: number): Promise<void> {
 }
 
 // [>]: Export wrapped functions with retry logic.
-export const createMatchByTeamIds = withRetry(createMatchByTeamIdsImpl);
+export const recordMatchWithElo = withRetry(recordMatchWithEloImpl);
 export const getMatchById = withRetry(getMatchByIdImpl);
+export const getMatchWithEloById = withRetry(getMatchWithEloByIdImpl);
 export const getAllMatches = withRetry(getAllMatchesImpl);
 export const getMatchesByTeamId = withRetry(getMatchesByTeamIdImpl);
 export const getMatchesByPlayerId = withRetry(getMatchesByPlayerIdImpl);
 export const deleteMatchById = withRetry(deleteMatchByIdImpl);
 
 // [>]: Export types for use in services.
-export type { MatchDbRow, MatchWithTeamsRow, MatchQueryOptions };
+export type {
+  MatchDbRow,
+  MatchWithTeamsRow,
+  MatchQueryOptions,
+  PlayerEloChangeInput,
+  TeamEloChangeInput,
+};
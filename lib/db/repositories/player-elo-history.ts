@@ -1,5 +1,7 @@
 // [>]: Player ELO history repository.
 // Tracks ELO changes for each player after matches.
+// Rows are written by record_match and removed with their match (ON DELETE
+// CASCADE), so this module only reads.
 
 import { getSupabaseClient } from "@/lib/db/client";
 import { withRetry } from "@/lib/db/retry";
@@ -16,15 +18,6 @@ interface PlayerEloHistoryRow {
   date: string;
 }
 
-// [>]: Input type for creating ELO history records.
-interface PlayerEloHistoryInput {
-  player_id: number;
-  match_id: number;
-  old_elo: number;
-  new_elo: number;
-  date: string;
-}
-
 // [>]: Query options for history filtering.
 interface HistoryQueryOptions {
   limit?: number;
@@ -33,76 +26,6 @@ interface HistoryQueryOptions {
   endDate?: string;
 }
 
-// [>]: Record a single player ELO update. Returns history ID.
-async function recordPlayerEloUpdateImpl(
-  data: PlayerEloHistoryInput,
-): Promise<number> {
-  const client = getSupabaseClient();
-
-  const difference = data.new_elo - data.old_elo;
-
-  const { data: result, error } = await client
-    .from("players_elo_history")
-    .insert({
-      player_id: data.player_id,
-      match_id: data.match_id,
-      old_elo: data.old_elo,
-      new_elo: data.new_elo,
-      difference,
-      date: data.date,
-    })
-    .select("history_id")
-    .single();
-
-  if (error) {
-    throw new OperationError(
-      `Failed to record player ELO history: ${error.message}`,
-    );
-  }
-
-  if (!result?.history_id) {
-    throw new OperationError(
-      "Failed to record player ELO history: no ID returned",
-    );
-  }
-
-  return result.history_id;
-}
-
-// [>]: Batch record player ELO updates (4 players per match).
-// Returns array of history IDs.
-async function batchRecordPlayerEloUpdatesImpl(
-  updates: PlayerEloHistoryInput[],
-): Promise<number[]> {
-  if (updates.length === 0) {
-    return [];
-  }
-
-  const client = getSupabaseClient();
-
-  const records = updates.map((update) => ({
-    player_id: update.player_id,
-    match_id: update.match_id,
-    old_elo: update.old_elo,
-    new_elo: update.new_elo,
-    difference: update.new_elo - update.old_elo,
-    date: update.date,
-  }));
-
-  const { data, error } = await client
-    .from("players_elo_history")
-    .insert(records)
-    .select("history_id");
-
-  if (error) {
-    throw new OperationError(
-      `Failed to batch record player ELO history: ${error.message}`,
-    );
-  }
-
-  return (data ?? []).map((row) => row.history_id);
-}
-
 // [>]: Get ELO history for a player with pagination and optional date filters.
 async function getPlayerEloHistoryImpl(
   playerId: number,
@@ -140,60 +63,8 @@ async function getPlayerEloHistoryImpl(
   return data ?? [];
 }
 
-// [>]: Get all player ELO records for a specific match.
-async function getPlayersEloHistoryByMatchIdImpl(
-  matchId: number,
-): Promise<PlayerEloHistoryRow[]> {
-  const client = getSupabaseClient();
-
-  const { data, error } = await client
-    .from("players_elo_history")
-    .select(
-      "history_id, player_id, match_id, old_elo, new_elo, difference, date",
-    )
-    .eq("match_id", matchId)
-    .order("date", { ascending: false });
-
-  if (error) {
-    throw new OperationError(
-      `Failed to get player ELO history for match: ${error.message}`,
-    );
-  }
-
-  return data ?? [];
-}
-
-// [>]: Delete all player ELO history records for a match.
-// Used when deleting a match to avoid FK constraint violations.
-async function deletePlayerEloHistoryByMatchIdImpl(
-  matchId: number,
-): Promise<void> {
-  const client = getSupabaseClient();
-
-  const { error } = await client
-    .from("players_elo_history")
-    .delete()
-    .eq("match_id", matchId);
-
-  if (error) {
-    throw new OperationError(
-      `Failed to delete player ELO history: ${error.message}`,
-    );
-  }
-}
-
 // [>]: Export wrapped functions with retry logic.
-export const recordPlayerEloUpdate = withRetry(recordPlayerEloUpdateImpl);
-export const batchRecordPlayerEloUpdates = withRetry(
-  batchRecordPlayerEloUpdatesImpl,
-);
 export const getPlayerEloHistory = withRetry(getPlayerEloHistoryImpl);
-export const getPlayersEloHistoryByMatchId = withRetry(
-  getPlayersEloHistoryByMatchIdImpl,
-);
-export const deletePlayerEloHistoryByMatchId = withRetry(
-  deletePlayerEloHistoryByMatchIdImpl,
-);
 
 // [>]: Export types for use in services.
-export type { PlayerEloHistoryRow, PlayerEloHistoryInput, HistoryQueryOptions };
+export type { PlayerEloHistoryRow, HistoryQueryOptions };
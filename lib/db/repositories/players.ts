@@ -4,10 +4,14 @@
 import { getSupabaseClient } from "@/lib/db/client";
 import { withRetry } from "@/lib/db/retry";
 import {
+  PlayerAlreadyExistsError,
   PlayerNotFoundError,
   PlayerOperationError,
 } from "@/lib/errors/api-errors";
 
+// [>]: Postgres error code raised by the unique index on lower(name).
+const UNIQUE_VIOLATION = "23505";
+
 // [>]: Database row type for raw Supabase responses.
 interface PlayerDbRow {
   player_id: number;
@@ -27,6 +31,7 @@ interface PlayerWithStatsRow extends PlayerDbRow {
 }
 
 // [>]: Create a new player. Returns full player row.
+// Throws PlayerAlreadyExistsError if the name is taken (case-insensitive).
 async function createPlayerImpl(
   name: string,
   globalElo: number = 1000,
@@ -40,6 +45,9 @@ async function createPlayerImpl(
     .single();
 
   if (error) {
+    if (error.code === UNIQUE_VIOLATION) {
+      throw new PlayerAlreadyExistsError(name);
+    }
     throw new PlayerOperationError(`Failed to create player: ${error.message}`);
   }
 
@@ -71,14 +79,38 @@ async function getPlayerByIdImpl(playerId: number): Promise<PlayerDbRow> {
   return data;
 }
 
-// [>]: Lookup player by name. Returns null if not found (for existence checks).
-async function getPlayerByNameImpl(name: string): Promise<PlayerDbRow | null> {
+// [>]: Lookup several players by ID in one query (WHERE player_id IN (...)).
+// Missing IDs are simply absent from the result; callers decide how to react.
+async function getPlayersByIdsImpl(
+  playerIds: number[],
+): Promise<PlayerDbRow[]> {
+  if (playerIds.length === 0) {
+    return [];
+  }
+
   const client = getSupabaseClient();
 
   const { data, error } = await client
     .from("players")
     .select("player_id, name, global_elo, created_at")
-    .eq("name", name)
+    .in("player_id", [...new Set(playerIds)]);
+
+  if (error) {
+    throw new PlayerOperationError(`Database error: ${error.message}`);
+  }
+
+  return data ?? [];
+}
+
+// [>]: Lookup player by name, case-insensitively. Returns null if not found
+// (for existence checks). Goes through RPC so the lookup can use the
+// lower(name) functional index.
+async function getPlayerByNameImpl(name: string): Promise<PlayerDbRow | null> {
+  const client = getSupabaseClient();
+
+  const { data, error } = await client
+    .rpc("get_player_by_name", { p_name: name })
+    .select("player_id, name, global_elo, created_at")
     .maybeSingle();
 
   if (error) {
@@ -107,7 +139,30 @@ async function getAllPlayersImpl(): Promise<PlayerWithStatsRow[]> {
   return data ?? [];
 }
 
-// [>]: Update player fields. Throws PlayerNotFoundError if player does not exist.
+// [>]: Get one page of players with stats, ordered by player_id.
+// Keyset pagination: pass the last player_id of the previous page as afterPlayerId.
+async function getPlayersPageImpl(
+  limit: number,
+  afterPlayerId?: number,
+): Promise<PlayerWithStatsRow[]> {
+  const client = getSupabaseClient();
+
+  const { data, error } = await client.rpc("get_players_with_stats_page", {
+    p_limit: limit,
+    p_after_player_id: afterPlayerId ?? null,
+  });
+
+  if (error) {
+    throw new PlayerOperationError(
+      `Failed to get players page: ${error.message}`,
+    );
+  }
+
+  return data ?? [];
+}
+
+// [>]: Update player fields. Throws PlayerNotFoundError if player does not exist
+// and PlayerAlreadyExistsError if the new name is taken.
 async function updatePlayerImpl(
   playerId: number,
   updates: { name?: string; global_elo?: number },
@@ -133,6 +188,9 @@ async function updatePlayerImpl(
     .select("player_id");
 
   if (error) {
+    if (error.code === UNIQUE_VIOLATION && updates.name !== undefined) {
+      throw new PlayerAlreadyExistsError(updates.name);
+    }
     throw new PlayerOperationError(`Failed to update player: ${error.message}`);
   }
 
@@ -141,32 +199,6 @@ async function updatePlayerImpl(
   }
 }
 
-// [>]: Batch update player ELOs. Used after match processing.
-async function batchUpdatePlayersEloImpl(
-  updates: Array<{ player_id: number; global_elo: number }>,
-): Promise<void> {
-  if (updates.length === 0) {
-    return;
-  }
-
-  const client = getSupabaseClient();
-
-  // [>]: Supabase does not support true batch updates with different values.
-  // Execute updates sequentially within the same function call.
-  for (const { player_id, global_elo } of updates) {
-    const { error } = await client
-      .from("players")
-      .update({ global_elo })
-      .eq("player_id", player_id);
-
-    if (error) {
-      throw new PlayerOperationError(
-        `Failed to update player ${player_id} ELO: ${error.message}`,
-      );
-    }
-  }
-}
-
 // [>]: Delete player by ID. Throws PlayerNotFoundError if not found.
 async function deletePlayerByIdImpl(playerId: number): Promise<void> {
   const client = getSupabaseClient();
@@ -189,10 +221,11 @@ async function deletePlayerByIdImpl(playerId: number): Promise<void> {
 // [>]: Export wrapped functions with retry logic.
 export const createPlayer = withRetry(createPlayerImpl);
 export const getPlayerById = withRetry(getPlayerByIdImpl);
+export const getPlayersByIds = withRetry(getPlayersByIdsImpl);
 export const getPlayerByName = withRetry(getPlayerByNameImpl);
 export const getAllPlayers = withRetry(getAllPlayersImpl);
+export const getPlayersPage = withRetry(getPlayersPageImpl);
 export const updatePlayer = withRetry(updatePlayerImpl);
-export const batchUpdatePlayersElo = withRetry(batchUpdatePlayersEloImpl);
 export const deletePlayerById = withRetry(deletePlayerByIdImpl);
 
 // [>]: Legacy export for backward compatibility with tests.
@@ -90,9 +90,60 @@ async function getTeamStatsImpl(teamId: number): Promise<TeamStatsRow> {
   return data;
 }
 
+// [>]: Get full stats for several teams in one round trip.
+// Returns rows in input order; throws TeamNotFoundError for the first missing
+// ID unless skipMissing is set, in which case missing IDs are left out.
+async function getTeamsStatsImpl(
+  teamIds: number[],
+  options: { skipMissing?: boolean } = {},
+): Promise<TeamStatsRow[]> {
+  const client = getSupabaseClient();
+
+  // [>]: Callers may repeat ids (e.g. a team on both sides of a page of
+  // matches); send each distinct id once and fan rows back out below.
+  const { data, error } = await client.rpc("get_teams_full_stats_batch", {
+    p_team_ids: [...new Set(teamIds)],
+  });
+
+  if (error) {
+    throw new OperationError(`Failed to get teams stats: ${error.message}`);
+  }
+
+  const rows: TeamStatsRow[] = data ?? [];
+  const rowsById = new Map<number, TeamStatsRow>();
+  for (const row of rows) {
+    rowsById.set(row.team_id, row);
+  }
+
+  const result: TeamStatsRow[] = [];
+  for (const teamId of teamIds) {
+    const row = rowsById.get(teamId);
+    if (row) {
+      result.push(row);
+    } else if (!options.skipMissing) {
+      throw new TeamNotFoundError(teamId);
+    }
+  }
+  return result;
+}
+
+// [>]: Refresh the match stats materialized views read by leaderboard RPCs.
+// Must be called after any write to the matches table.
+async function refreshMatchStatsImpl(): Promise<void> {
+  const client = getSupabaseClient();
+
+  const { error } = await client.rpc("refresh_match_stats");
+
+  if (error) {
+    throw new OperationError(`Failed to refresh match stats: ${error.message}`);
+  }
+}
+
 // [>]: Export wrapped functions with retry logic.
 export const getPlayerStats = withRetry(getPlayerStatsImpl);
 export const getTeamStats = withRetry(getTeamStatsImpl);
+export const getTeamsStats = withRetry(getTeamsStatsImpl);
+export const refreshMatchStats = withRetry(refreshMatchStatsImpl);
 
 // [>]: Export types for use in services.
 export type { PlayerStatsRow, TeamStatsRow };
@@ -84,6 +84,27 @@ async function createTeamByPlayerIdsImpl(
   return data.team_id;
 }
 
+// [>]: Create the teams pairing one player with every other player.
+// The pair list is built in SQL; pairs that already exist are left untouched.
+// Returns the number of teams created.
+async function createTeamsForPlayerImpl(
+  playerId: number,
+  globalElo: number = 1000,
+): Promise<number> {
+  const client = getSupabaseClient();
+
+  const { data, error } = await client.rpc("create_teams_for_player", {
+    p_player_id: playerId,
+    p_global_elo: globalElo,
+  });
+
+  if (error) {
+    throw new TeamOperationError(`Failed to create teams: ${error.message}`);
+  }
+
+  return data ?? 0;
+}
+
 // [>]: Lookup team by ID. Throws TeamNotFoundError if not found.
 async function getTeamByIdImpl(teamId: number): Promise<TeamDbRow> {
   const client = getSupabaseClient();
@@ -208,39 +229,6 @@ async function updateTeamImpl(
   }
 }
 
-// [>]: Batch update team ELOs and last_match_at. Used after match processing.
-async function batchUpdateTeamsEloImpl(
-  updates: Array<{
-    team_id: number;
-    global_elo: number;
-    last_match_at?: string;
-  }>,
-): Promise<void> {
-  if (updates.length === 0) {
-    return;
-  }
-
-  const client = getSupabaseClient();
-
-  for (const { team_id, global_elo, last_match_at } of updates) {
-    const updateFields: Record<string, unknown> = { global_elo };
-    if (last_match_at) {
-      updateFields.last_match_at = last_match_at;
-    }
-
-    const { error } = await client
-      .from("teams")
-      .update(updateFields)
-      .eq("team_id", team_id);
-
-    if (error) {
-      throw new TeamOperationError(
-        `Failed to update team ${team_id} ELO: ${error.message}`,
-      );
-    }
-  }
-}
-
 // [>]: Delete team by ID. Throws TeamNotFoundError if not found.
 async function deleteTeamByIdImpl(teamId: number): Promise<void> {
   const client = getSupabaseClient();
@@ -289,12 +277,12 @@ async function getActiveTeamsWithStatsImpl(options?: {
 
 // [>]: Export wrapped functions with retry logic.
 export const createTeamByPlayerIds = withRetry(createTeamByPlayerIdsImpl);
+export const createTeamsForPlayer = withRetry(createTeamsForPlayerImpl);
 export const getTeamById = withRetry(getTeamByIdImpl);
 export const getTeamByPlayerIds = withRetry(getTeamByPlayerIdsImpl);
 export const getAllTeams = withRetry(getAllTeamsImpl);
 export const getTeamsByPlayerId = withRetry(getTeamsByPlayerIdImpl);
 export const updateTeam = withRetry(updateTeamImpl);
-export const batchUpdateTeamsElo = withRetry(batchUpdateTeamsEloImpl);
 export const deleteTeamById = withRetry(deleteTeamByIdImpl);
 export const getActiveTeamsWithStats = withRetry(getActiveTeamsWithStatsImpl);
 
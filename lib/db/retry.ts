@@ -1,5 +1,7 @@
 // [>]: Retry utility for database operations. Matches Python backend pattern.
 
+import { ApiError } from "@/lib/errors/api-errors";
+
 export interface RetryOptions {
   maxRetries?: number;
   retryDelay?: number;
@@ -15,7 +17,8 @@ type AsyncFunction<T extends unknown[], R> = (...args: T) => Promise<R>;
  *
  * @param fn - The async function to wrap.
  * @param options - Configuration for max retries and delay between attempts.
- * @returns A wrapped function that retries on failure.
+ * @returns A wrapped function that retries on failure. ApiErrors with a 4xx
+ *   status are rethrown immediately.
  */
 export function withRetry<T extends unknown[], R>(
   fn: AsyncFunction<T, R>,
@@ -32,6 +35,12 @@ export function withRetry<T extends unknown[], R>(
       try {
         return await fn(...args);
       } catch (error) {
+        // [>]: Client errors (not found, duplicate name, ...) are answers,
+        // not transient failures: retrying would only repeat them.
+        if (error instanceof ApiError && error.statusCode < 500) {
+          throw error;
+        }
+
         lastError = error;
         const message = error instanceof Error ? error.message : String(error);
         console.warn(`Attempt ${attempt}/${maxRetries} failed: ${message}`);
@@ -3,12 +3,31 @@
 // Direct port from Python backend/app/services/elo.py.
 
 import { ValidationError } from "@/lib/errors/api-errors";
+import { MAX_ELO } from "@/lib/types/schemas/player";
 
 // [>]: K-factor tiers matching Python backend.
 export const K_TIER1 = 200; // ELO < 1200
 export const K_TIER2 = 100; // 1200 <= ELO < 1800
 export const K_TIER3 = 50; // ELO >= 1800
 
+// [>]: Three-entry K-factor table indexed by the number of tier thresholds
+// reached, so the lookup is two comparisons and no branches.
+const K_TIER2_THRESHOLD = 1200;
+const K_TIER3_THRESHOLD = 1800;
+const K_FACTOR_TABLE = [K_TIER1, K_TIER2, K_TIER3] as const;
+
+// [>]: 10 ** (x / 400) == exp(x * ln(10) / 400); precomputed so the win
+// probability is a single multiply and Math.exp instead of a general power.
+const ELO_ALPHA = Math.LN10 / 400;
+
+// [>]: Win probability for every integer ELO delta in [-4000, 4000], built
+// once at import (8001 doubles, ~64 KB). Other deltas use the formula.
+const WIN_PROB_DELTA_OFFSET = 4000;
+const WIN_PROB_TABLE = Float64Array.from(
+  { length: 2 * WIN_PROB_DELTA_OFFSET + 1 },
+  (_, i) => 1 / (1 + Math.exp((i - WIN_PROB_DELTA_OFFSET) * ELO_ALPHA)),
+);
+
 // [>]: Input data structure for pool correction calculation.
 interface CompetitorData {
   old_elo: number;
@@ -43,9 +62,65 @@ export interface TeamWithPlayers {
   player2: PlayerForElo;
 }
 
+// [>]: Unchecked kernels shared by every calculation path.
+// Public functions validate their inputs once, then call these directly.
+function teamEloKernel(member1Elo: number, member2Elo: number): number {
+  // [>]: Ratings are non-negative integers well below 2^30, so >> 1 truncates.
+  return (member1Elo + member2Elo) >> 1;
+}
+
+function winProbabilityKernel(
+  competitorAElo: number,
+  competitorBElo: number,
+): number {
+  return winProbabilityFromDeltaKernel(competitorBElo - competitorAElo);
+}
+
+// [>]: Win probability of A given ELO_B - ELO_A.
+function winProbabilityFromDeltaKernel(eloDelta: number): number {
+  const index = eloDelta + WIN_PROB_DELTA_OFFSET;
+  if ((index | 0) === index && index >= 0 && index < WIN_PROB_TABLE.length) {
+    return WIN_PROB_TABLE[index];
+  }
+  return 1 / (1 + Math.exp(eloDelta * ELO_ALPHA));
+}
+
+function kFactorKernel(competitorElo: number): number {
+  return K_FACTOR_TABLE[
+    Number(competitorElo >= K_TIER2_THRESHOLD) +
+      Number(competitorElo >= K_TIER3_THRESHOLD)
+  ];
+}
+
+// [>]: Untruncated change; pool corrections stay in floating point and
+// truncate once per competitor at the end.
+function rawEloChangeKernel(
+  kFactor: number,
+  winProbability: number,
+  matchResult: number,
+): number {
+  return kFactor * (matchResult - winProbability);
+}
+
+// [>]: History rows store ratings as SMALLINT with a non-negative CHECK, so a
+// change may not take a rating outside [0, MAX_ELO]. A clamped change breaks
+// the zero-sum pool by the clamped amount.
+function clampEloChangeKernel(elo: number, change: number): number {
+  return Math.min(Math.max(change, -elo), MAX_ELO - elo);
+}
+
+function eloChangeKernel(
+  kFactor: number,
+  winProbability: number,
+  matchResult: number,
+): number {
+  return Math.trunc(rawEloChangeKernel(kFactor, winProbability, matchResult));
+}
+
 /**
  * Calculate team ELO as the average of two player ELO ratings.
- * Uses Math.trunc() for integer conversion to match Python int() behavior.
+ * Uses an integer shift, equivalent to Python int() on the mean for
+ * non-negative integer ratings.
  *
  * @param member1Elo - ELO rating of member 1.
  * @param member2Elo - ELO rating of member 2.
@@ -59,7 +134,7 @@ export function calculateTeamElo(
   if (member1Elo < 0 || member2Elo < 0) {
     throw new ValidationError("ELO ratings must be non-negative");
   }
-  return Math.trunc((member1Elo + member2Elo) / 2);
+  return teamEloKernel(member1Elo, member2Elo);
 }
 
 /**
@@ -79,8 +154,7 @@ export function calculateWinProbability(
     throw new ValidationError("ELO ratings must be non-negative");
   }
 
-  const exponent = (competitorBElo - competitorAElo) / 400;
-  return 1 / (1 + Math.pow(10, exponent));
+  return winProbabilityKernel(competitorAElo, competitorBElo);
 }
 
 /**
@@ -100,15 +174,32 @@ export function determineKFactor(competitorElo: number): number {
     throw new ValidationError("ELO rating must be non-negative");
   }
 
-  if (competitorElo < 1200) {
-    return K_TIER1;
-  }
+  return kFactorKernel(competitorElo);
+}
+
+/**
+ * Determine K factors for many ratings at once, for use with
+ * calculateEloChangesBatch.
+ *
+ * @param competitorElos - ELO ratings of the competitors.
+ * @returns K factor of each competitor, in input order.
+ * @throws ValidationError if any ELO rating is negative.
+ */
+export function determineKFactorsBatch(
+  competitorElos: ArrayLike<number>,
+): Int32Array {
+  const count = competitorElos.length;
+  const kFactors = new Int32Array(count);
 
-  if (competitorElo < 1800) {
-    return K_TIER2;
+  for (let i = 0; i < count; i++) {
+    const elo = competitorElos[i];
+    if (elo < 0) {
+      throw new ValidationError("ELO rating must be non-negative");
+    }
+    kFactors[i] = kFactorKernel(elo);
   }
 
-  return K_TIER3;
+  return kFactors;
 }
 
 /**
@@ -135,8 +226,98 @@ export function calculateEloChange(
     throw new ValidationError("Win probability must be between 0 and 1");
   }
 
-  const factor = determineKFactor(competitorElo);
-  return Math.trunc(factor * (matchResult - winProbability));
+  return eloChangeKernel(
+    kFactorKernel(competitorElo),
+    winProbability,
+    matchResult,
+  );
+}
+
+/**
+ * Calculate pool-corrected ELO changes for many groups of competitors at once.
+ *
+ * Inputs are parallel arrays laid out group after group: with a group size of
+ * 4, indices 0-3 are the first match, 4-7 the second, and so on. Each group
+ * gets its own pool correction, exactly as in
+ * calculateEloChangesWithPoolCorrection, without building per-competitor
+ * objects.
+ *
+ * @param oldElos - Current ELO of each competitor.
+ * @param winProbs - Win probability of each competitor (0-1).
+ * @param matchResults - Match result of each competitor (1 for win, 0 for loss).
+ * @param kFactors - K-factor of each competitor.
+ * @param groupSize - Number of competitors per pool.
+ * @returns Corrected ELO change of each competitor, in input order.
+ * @throws ValidationError if array lengths do not match or are not a multiple of groupSize.
+ * @throws ValidationError if any rating, probability, result or K-factor is invalid.
+ */
+export function calculateEloChangesBatch(
+  oldElos: ArrayLike<number>,
+  winProbs: ArrayLike<number>,
+  matchResults: ArrayLike<number>,
+  kFactors: ArrayLike<number>,
+  groupSize: number,
+): Int32Array {
+  const count = oldElos.length;
+  if (
+    winProbs.length !== count ||
+    matchResults.length !== count ||
+    kFactors.length !== count
+  ) {
+    throw new ValidationError("Batch arrays must have the same length");
+  }
+  if (groupSize <= 0 || count % groupSize !== 0) {
+    throw new ValidationError("Batch length must be a multiple of group size");
+  }
+
+  // [>]: Validate every competitor up front with the calculateEloChange rules,
+  // so the kernels below never see a negative rating or an out-of-range
+  // probability. The negated comparisons also reject NaN.
+  for (let i = 0; i < count; i++) {
+    if (!(oldElos[i] >= 0)) {
+      throw new ValidationError("ELO rating must be non-negative");
+    }
+    if (!(winProbs[i] >= 0 && winProbs[i] <= 1)) {
+      throw new ValidationError("Win probability must be between 0 and 1");
+    }
+    if (matchResults[i] !== 0 && matchResults[i] !== 1) {
+      throw new ValidationError("Match result must be 0 or 1");
+    }
+    if (!(kFactors[i] >= 0 && kFactors[i] <= K_TIER1)) {
+      throw new ValidationError(`K factor must be between 0 and ${K_TIER1}`);
+    }
+  }
+
+  const changes = new Int32Array(count);
+
+  for (let start = 0; start < count; start += groupSize) {
+    const end = start + groupSize;
+    let totalKFactor = 0;
+    let sumOfInitialChanges = 0;
+
+    // [>]: Sum the untruncated initial changes for the group.
+    for (let i = start; i < end; i++) {
+      totalKFactor += kFactors[i];
+      sumOfInitialChanges += rawEloChangeKernel(
+        kFactors[i],
+        winProbs[i],
+        matchResults[i],
+      );
+    }
+
+    // [>]: Apply pool system correction, truncating once per competitor.
+    const correctionFactorPerK =
+      totalKFactor !== 0 ? -sumOfInitialChanges / totalKFactor : 0;
+
+    for (let i = start; i < end; i++) {
+      changes[i] = Math.trunc(
+        rawEloChangeKernel(kFactors[i], winProbs[i], matchResults[i]) +
+          kFactors[i] * correctionFactorPerK,
+      );
+    }
+  }
+
+  return changes;
 }
 
 /**
@@ -148,48 +329,211 @@ export function calculateEloChange(
  *
  * @param competitorsData - Map of competitor IDs to their data.
  * @returns Map of competitor IDs to ELO change results.
+ * @throws ValidationError if any rating, probability, result or K-factor is invalid.
  */
 export function calculateEloChangesWithPoolCorrection(
   competitorsData: CompetitorsDataMap,
 ): EloChangesMap {
-  const initialEloChanges: Record<number, number> = {};
-  let totalKFactor = 0;
-  let sumOfInitialChanges = 0;
-
-  // [>]: Calculate initial changes for each competitor.
-  for (const [compIdStr, data] of Object.entries(competitorsData)) {
-    const compId = Number(compIdStr);
-    const initialChange = calculateEloChange(
-      data.old_elo,
-      data.win_prob,
-      data.match_result,
-    );
-    initialEloChanges[compId] = initialChange;
-    totalKFactor += data.k_factor;
-    sumOfInitialChanges += initialChange;
+  // [>]: Unpack into parallel arrays and run a single-group batch.
+  // Keys only: Object.entries would allocate a [key, value] pair per entry.
+  const ids = Object.keys(competitorsData);
+  const count = ids.length;
+  const oldElos = new Float64Array(count);
+  const winProbs = new Float64Array(count);
+  const matchResults = new Uint8Array(count);
+  const kFactors = new Float64Array(count);
+
+  for (let i = 0; i < count; i++) {
+    const data = competitorsData[Number(ids[i])];
+    oldElos[i] = data.old_elo;
+    winProbs[i] = data.win_prob;
+    matchResults[i] = data.match_result;
+    kFactors[i] = data.k_factor;
   }
 
-  // [>]: Apply pool system correction.
+  const changes =
+    count === 0
+      ? new Int32Array(0)
+      : calculateEloChangesBatch(
+          oldElos,
+          winProbs,
+          matchResults,
+          kFactors,
+          count,
+        );
+
   const correctedEloChanges: EloChangesMap = {};
-  const correctionFactorPerK =
-    totalKFactor !== 0 ? -sumOfInitialChanges / totalKFactor : 0;
-
-  for (const [compIdStr, data] of Object.entries(competitorsData)) {
-    const compId = Number(compIdStr);
-    const initialChange = initialEloChanges[compId];
-    const correctedChange =
-      initialChange + Math.trunc(data.k_factor * correctionFactorPerK);
-
-    correctedEloChanges[compId] = {
-      old_elo: data.old_elo,
-      new_elo: data.old_elo + correctedChange,
-      difference: correctedChange,
+  for (let i = 0; i < count; i++) {
+    correctedEloChanges[Number(ids[i])] = {
+      old_elo: oldElos[i],
+      new_elo: oldElos[i] + changes[i],
+      difference: changes[i],
     };
   }
 
   return correctedEloChanges;
 }
 
+// [>]: Negative ratings are the only invalid input the match path can see.
+function assertNonNegativeElos(...elos: number[]): void {
+  for (const elo of elos) {
+    if (elo < 0) {
+      throw new ValidationError("ELO ratings must be non-negative");
+    }
+  }
+}
+
+// [>]: Player pool correction on already-validated ratings, unrolled for
+// the fixed 2v2 shape: four scalars in, four changes written to out at
+// offset (winner1, winner2, loser1, loser2). No per-player objects.
+function playerChangesKernel(
+  winner1Elo: number,
+  winner2Elo: number,
+  loser1Elo: number,
+  loser2Elo: number,
+  out: Int32Array,
+  offset: number,
+): void {
+  const winProb = winProbabilityFromDeltaKernel(
+    ((loser1Elo + loser2Elo) >> 1) - ((winner1Elo + winner2Elo) >> 1),
+  );
+  const loseProb = 1 - winProb;
+
+  const winner1K = kFactorKernel(winner1Elo);
+  const winner2K = kFactorKernel(winner2Elo);
+  const loser1K = kFactorKernel(loser1Elo);
+  const loser2K = kFactorKernel(loser2Elo);
+
+  const winner1Initial = rawEloChangeKernel(winner1K, winProb, 1);
+  const winner2Initial = rawEloChangeKernel(winner2K, winProb, 1);
+  const loser1Initial = rawEloChangeKernel(loser1K, loseProb, 0);
+  const loser2Initial = rawEloChangeKernel(loser2K, loseProb, 0);
+
+  // [>]: K-factors are always positive here, so the total is never zero.
+  const correctionFactorPerK =
+    -(winner1Initial + winner2Initial + loser1Initial + loser2Initial) /
+    (winner1K + winner2K + loser1K + loser2K);
+
+  out[offset] = clampEloChangeKernel(
+    winner1Elo,
+    Math.trunc(winner1Initial + winner1K * correctionFactorPerK),
+  );
+  out[offset + 1] = clampEloChangeKernel(
+    winner2Elo,
+    Math.trunc(winner2Initial + winner2K * correctionFactorPerK),
+  );
+  out[offset + 2] = clampEloChangeKernel(
+    loser1Elo,
+    Math.trunc(loser1Initial + loser1K * correctionFactorPerK),
+  );
+  out[offset + 3] = clampEloChangeKernel(
+    loser2Elo,
+    Math.trunc(loser2Initial + loser2K * correctionFactorPerK),
+  );
+}
+
+// [>]: Scratch buffer for the single-match path; reused on every call.
+const PLAYER_CHANGES_SCRATCH = new Int32Array(4);
+
+function playersEloChangeKernel(
+  winningTeam: TeamWithPlayers,
+  losingTeam: TeamWithPlayers,
+): EloChangesMap {
+  const winner1Elo = winningTeam.player1.global_elo;
+  const winner2Elo = winningTeam.player2.global_elo;
+  const loser1Elo = losingTeam.player1.global_elo;
+  const loser2Elo = losingTeam.player2.global_elo;
+
+  const changes = PLAYER_CHANGES_SCRATCH;
+  playerChangesKernel(
+    winner1Elo,
+    winner2Elo,
+    loser1Elo,
+    loser2Elo,
+    changes,
+    0,
+  );
+
+  return {
+    // [>]: Winning team players.
+    [winningTeam.player1.player_id]: {
+      old_elo: winner1Elo,
+      new_elo: winner1Elo + changes[0],
+      difference: changes[0],
+    },
+    [winningTeam.player2.player_id]: {
+      old_elo: winner2Elo,
+      new_elo: winner2Elo + changes[1],
+      difference: changes[1],
+    },
+    // [>]: Losing team players.
+    [losingTeam.player1.player_id]: {
+      old_elo: loser1Elo,
+      new_elo: loser1Elo + changes[2],
+      difference: changes[2],
+    },
+    [losingTeam.player2.player_id]: {
+      old_elo: loser2Elo,
+      new_elo: loser2Elo + changes[3],
+      difference: changes[3],
+    },
+  };
+}
+
+// [>]: Team pool correction on already-validated ratings, unrolled for two.
+// Writes the winner and loser changes to out at offset.
+function teamChangesKernel(
+  winnerElo: number,
+  loserElo: number,
+  out: Int32Array,
+  offset: number,
+): void {
+  const winProbability = winProbabilityKernel(winnerElo, loserElo);
+
+  const winnerK = kFactorKernel(winnerElo);
+  const loserK = kFactorKernel(loserElo);
+  const winnerInitial = rawEloChangeKernel(winnerK, winProbability, 1);
+  const loserInitial = rawEloChangeKernel(loserK, 1 - winProbability, 0);
+  const correctionFactorPerK =
+    -(winnerInitial + loserInitial) / (winnerK + loserK);
+
+  out[offset] = clampEloChangeKernel(
+    winnerElo,
+    Math.trunc(winnerInitial + winnerK * correctionFactorPerK),
+  );
+  out[offset + 1] = clampEloChangeKernel(
+    loserElo,
+    Math.trunc(loserInitial + loserK * correctionFactorPerK),
+  );
+}
+
+// [>]: Scratch buffer for the single-match path; reused on every call.
+const TEAM_CHANGES_SCRATCH = new Int32Array(2);
+
+function teamEloChangeKernel(
+  winningTeam: TeamWithPlayers,
+  losingTeam: TeamWithPlayers,
+): EloChangesMap {
+  const winnerElo = winningTeam.global_elo;
+  const loserElo = losingTeam.global_elo;
+
+  const changes = TEAM_CHANGES_SCRATCH;
+  teamChangesKernel(winnerElo, loserElo, changes, 0);
+
+  return {
+    [winningTeam.team_id]: {
+      old_elo: winnerElo,
+      new_elo: winnerElo + changes[0],
+      difference: changes[0],
+    },
+    [losingTeam.team_id]: {
+      old_elo: loserElo,
+      new_elo: loserElo + changes[1],
+      difference: changes[1],
+    },
+  };
+}
+
 /**
  * Calculate ELO changes for each player in a match.
  *
@@ -204,46 +548,14 @@ export function calculatePlayersEloChange(
   winningTeam: TeamWithPlayers,
   losingTeam: TeamWithPlayers,
 ): EloChangesMap {
-  const eloWinner = calculateTeamElo(
+  assertNonNegativeElos(
     winningTeam.player1.global_elo,
     winningTeam.player2.global_elo,
-  );
-  const eloLoser = calculateTeamElo(
     losingTeam.player1.global_elo,
     losingTeam.player2.global_elo,
   );
-  const winProb = calculateWinProbability(eloWinner, eloLoser);
 
-  const allPlayersData: CompetitorsDataMap = {
-    // [>]: Winning team players.
-    [winningTeam.player1.player_id]: {
-      old_elo: winningTeam.player1.global_elo,
-      win_prob: winProb,
-      match_result: 1,
-      k_factor: determineKFactor(winningTeam.player1.global_elo),
-    },
-    [winningTeam.player2.player_id]: {
-      old_elo: winningTeam.player2.global_elo,
-      win_prob: winProb,
-      match_result: 1,
-      k_factor: determineKFactor(winningTeam.player2.global_elo),
-    },
-    // [>]: Losing team players.
-    [losingTeam.player1.player_id]: {
-      old_elo: losingTeam.player1.global_elo,
-      win_prob: 1 - winProb,
-      match_result: 0,
-      k_factor: determineKFactor(losingTeam.player1.global_elo),
-    },
-    [losingTeam.player2.player_id]: {
-      old_elo: losingTeam.player2.global_elo,
-      win_prob: 1 - winProb,
-      match_result: 0,
-      k_factor: determineKFactor(losingTeam.player2.global_elo),
-    },
-  };
-
-  return calculateEloChangesWithPoolCorrection(allPlayersData);
+  return playersEloChangeKernel(winningTeam, losingTeam);
 }
 
 /**
@@ -260,27 +572,82 @@ export function calculateTeamEloChange(
   winningTeam: TeamWithPlayers,
   losingTeam: TeamWithPlayers,
 ): EloChangesMap {
-  const winProbability = calculateWinProbability(
-    winningTeam.global_elo,
-    losingTeam.global_elo,
-  );
+  assertNonNegativeElos(winningTeam.global_elo, losingTeam.global_elo);
 
-  const teamsData: CompetitorsDataMap = {
-    [winningTeam.team_id]: {
-      old_elo: winningTeam.global_elo,
-      win_prob: winProbability,
-      match_result: 1,
-      k_factor: determineKFactor(winningTeam.global_elo),
-    },
-    [losingTeam.team_id]: {
-      old_elo: losingTeam.global_elo,
-      win_prob: 1 - winProbability,
-      match_result: 0,
-      k_factor: determineKFactor(losingTeam.global_elo),
-    },
-  };
+  return teamEloChangeKernel(winningTeam, losingTeam);
+}
+
+/**
+ * Calculate player ELO changes for many independent matches at once.
+ *
+ * Ratings are laid out four per match in the order winner1, winner2, loser1,
+ * loser2; the returned changes use the same layout. Every match is scored
+ * from the ratings given, with no carry-over between matches.
+ *
+ * @param playerElos - Player ELO ratings, four per match.
+ * @returns ELO change of each player, in input order.
+ * @throws ValidationError if the length is not a multiple of 4 or any ELO is negative.
+ */
+export function calculatePlayersEloChangesBatch(
+  playerElos: ArrayLike<number>,
+): Int32Array {
+  const count = playerElos.length;
+  if (count % 4 !== 0) {
+    throw new ValidationError("Batch length must be a multiple of 4");
+  }
+
+  const changes = new Int32Array(count);
+
+  for (let offset = 0; offset < count; offset += 4) {
+    const winner1Elo = playerElos[offset];
+    const winner2Elo = playerElos[offset + 1];
+    const loser1Elo = playerElos[offset + 2];
+    const loser2Elo = playerElos[offset + 3];
+    assertNonNegativeElos(winner1Elo, winner2Elo, loser1Elo, loser2Elo);
+
+    playerChangesKernel(
+      winner1Elo,
+      winner2Elo,
+      loser1Elo,
+      loser2Elo,
+      changes,
+      offset,
+    );
+  }
+
+  return changes;
+}
+
+/**
+ * Calculate team ELO changes for many independent matches at once.
+ *
+ * Ratings are laid out two per match in the order winner, loser; the
+ * returned changes use the same layout. Every match is scored from the
+ * ratings given, with no carry-over between matches.
+ *
+ * @param teamElos - Team ELO ratings, two per match.
+ * @returns ELO change of each team, in input order.
+ * @throws ValidationError if the length is odd or any ELO is negative.
+ */
+export function calculateTeamEloChangesBatch(
+  teamElos: ArrayLike<number>,
+): Int32Array {
+  const count = teamElos.length;
+  if (count % 2 !== 0) {
+    throw new ValidationError("Batch length must be a multiple of 2");
+  }
+
+  const changes = new Int32Array(count);
 
-  return calculateEloChangesWithPoolCorrection(teamsData);
+  for (let offset = 0; offset < count; offset += 2) {
+    const winnerElo = teamElos[offset];
+    const loserElo = teamElos[offset + 1];
+    assertNonNegativeElos(winnerElo, loserElo);
+
+    teamChangesKernel(winnerElo, loserElo, changes, offset);
+  }
+
+  return changes;
 }
 
 /**
@@ -304,8 +671,18 @@ export function processMatchResult(
     throw new ValidationError("All players must be provided");
   }
 
-  const playersEloChange = calculatePlayersEloChange(winningTeam, losingTeam);
-  const teamEloChange = calculateTeamEloChange(winningTeam, losingTeam);
+  // [>]: Single validation pass over all six ratings, then both kernels.
+  assertNonNegativeElos(
+    winningTeam.player1.global_elo,
+    winningTeam.player2.global_elo,
+    losingTeam.player1.global_elo,
+    losingTeam.player2.global_elo,
+    winningTeam.global_elo,
+    losingTeam.global_elo,
+  );
 
-  return [playersEloChange, teamEloChange];
+  return [
+    playersEloChangeKernel(winningTeam, losingTeam),
+    teamEloChangeKernel(winningTeam, losingTeam),
+  ];
 }
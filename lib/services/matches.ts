@@ -2,27 +2,23 @@
 // This is the most complex service, coordinating multiple repositories and the ELO service.
 
 import {
-  createMatchByTeamIds,
+  recordMatchWithElo,
+  type PlayerEloChangeInput,
   getMatchById,
+  getMatchWithEloById,
   getAllMatches as getAllMatchesRepo,
   getMatchesByTeamId as getMatchesByTeamIdRepo,
   getMatchesByPlayerId as getMatchesByPlayerIdRepo,
   deleteMatchById,
 } from "@/lib/db/repositories/matches";
-import { batchUpdatePlayersElo } from "@/lib/db/repositories/players";
-import { batchUpdateTeamsElo } from "@/lib/db/repositories/teams";
+import { refreshMatchStats } from "@/lib/db/repositories/stats";
+import { invalidatePlayerCache } from "@/lib/services/players";
+import { getTeamsByIds } from "@/lib/services/teams";
 import {
-  batchRecordPlayerEloUpdates,
-  getPlayersEloHistoryByMatchId,
-  deletePlayerEloHistoryByMatchId,
-} from "@/lib/db/repositories/player-elo-history";
-import {
-  batchRecordTeamEloUpdates,
-  getTeamsEloHistoryByMatchId,
-  deleteTeamEloHistoryByMatchId,
-} from "@/lib/db/repositories/team-elo-history";
-import { getTeam } from "@/lib/services/teams";
-import { processMatchResult, type TeamWithPlayers } from "@/lib/services/elo";
+  processMatchResult,
+  type EloChangesMap,
+  type TeamWithPlayers,
+} from "@/lib/services/elo";
 import {
   InvalidMatchTeamsError,
   MatchCreationError,
@@ -36,6 +32,7 @@ import type {
   MatchResponse,
   MatchWithEloResponse,
 } from "@/lib/types/schemas/match";
+import type { TeamResponse } from "@/lib/types/schemas/team";
 
 // [>]: Query options for match filtering.
 interface MatchQueryOptions {
@@ -52,9 +49,9 @@ export async function getMatch(matchId: number): Promise<MatchResponse> {
   const matchData = await getMatchById(matchId);
 
   // [>]: Fetch team details.
-  const [winnerTeam, loserTeam] = await Promise.all([
-    getTeam(matchData.winner_team_id),
-    getTeam(matchData.loser_team_id),
+  const [winnerTeam, loserTeam] = await getTeamsByIds([
+    matchData.winner_team_id,
+    matchData.loser_team_id,
   ]);
 
   return {
@@ -106,6 +103,37 @@ export async function getMatches(
   return matchesData.map(mapToMatchResponse);
 }
 
+// [>]: Page size used when iterating over the full match list.
+const MATCH_ITER_PAGE_SIZE = 1000;
+
+// [>]: Iterate over matches page by page without materializing the full list.
+// Only one page of rows is held in memory at a time.
+export async function* iterMatches(
+  options: Omit<MatchQueryOptions, "skip" | "limit"> & { limit?: number } = {},
+  pageSize: number = MATCH_ITER_PAGE_SIZE,
+): AsyncGenerator<MatchResponse> {
+  const { limit = Infinity, ...filters } = options;
+
+  let skip = 0;
+  while (skip < limit) {
+    const page = await getMatches({
+      ...filters,
+      skip,
+      limit: Math.min(pageSize, limit - skip),
+    });
+
+    for (const match of page) {
+      yield match;
+    }
+
+    // [>]: A short page means the end of the result set.
+    if (page.length < pageSize) {
+      return;
+    }
+    skip += page.length;
+  }
+}
+
 // [>]: Get matches for a specific player (includes elo_changes).
 export async function getMatchesByPlayer(
   playerId: number,
@@ -148,13 +176,10 @@ export async function getMatchesWithTeamElo(
 // Orchestration steps:
 // 1. Validate winner !== loser
 // 2. Fetch both teams with players
-// 3. Create match record
-// 4. Calculate ELO changes (uses elo.ts)
-// 5. Batch update player ELOs
-// 6. Batch update team ELOs
-// 7. Record player ELO history
-// 8. Record team ELO history
-// 9. Return match with ELO changes
+// 3. Calculate ELO changes (uses elo.ts)
+// 4. Record match, ELO updates and ELO history in one transaction
+// 5. Refresh leaderboard match stats
+// 6. Return match with ELO changes
 export async function createNewMatch(
   data: MatchCreate,
 ): Promise<MatchWithEloResponse> {
@@ -167,9 +192,9 @@ export async function createNewMatch(
 
   try {
     // [>]: Step 2: Get team details with players.
-    const [winnerTeamData, loserTeamData] = await Promise.all([
-      getTeam(data.winner_team_id),
-      getTeam(data.loser_team_id),
+    const [winnerTeamData, loserTeamData] = await getTeamsByIds([
+      data.winner_team_id,
+      data.loser_team_id,
     ]);
 
     // [>]: Prepare teams for ELO calculation (requires player data).
@@ -206,78 +231,58 @@ export async function createNewMatch(
       },
     };
 
-    // [>]: Step 3: Create match record.
-    const matchId = await createMatchByTeamIds(
-      data.winner_team_id,
-      data.loser_team_id,
-      data.played_at,
-      data.is_fanny,
-      data.notes ?? undefined,
-    );
-
-    // [>]: Step 4: Calculate ELO changes.
+    // [>]: Step 3: Calculate ELO changes.
     const [playersChange, teamsChange] = processMatchResult(
       winningTeam,
       losingTeam,
     );
 
-    // [>]: Step 5: Batch update player ELOs.
-    const playerUpdates = Object.entries(playersChange).map(
-      ([playerIdStr, change]) => ({
-        player_id: Number(playerIdStr),
-        global_elo: change.new_elo,
-      }),
-    );
-    await batchUpdatePlayersElo(playerUpdates);
-
-    // [>]: Step 6: Record player ELO history.
-    const playerHistoryUpdates = Object.entries(playersChange).map(
-      ([playerIdStr, change]) => ({
-        player_id: Number(playerIdStr),
-        match_id: matchId,
-        old_elo: change.old_elo,
-        new_elo: change.new_elo,
-        date: data.played_at,
-      }),
-    );
-    await batchRecordPlayerEloUpdates(playerHistoryUpdates);
-
-    // [>]: Step 7: Batch update team ELOs.
-    const teamUpdates = Object.entries(teamsChange).map(
-      ([teamIdStr, change]) => ({
-        team_id: Number(teamIdStr),
-        global_elo: change.new_elo,
-        last_match_at: data.played_at,
-      }),
-    );
-    await batchUpdateTeamsElo(teamUpdates);
-
-    // [>]: Step 8: Record team ELO history.
-    const teamHistoryUpdates = Object.entries(teamsChange).map(
-      ([teamIdStr, change]) => ({
-        team_id: Number(teamIdStr),
-        match_id: matchId,
-        old_elo: change.old_elo,
-        new_elo: change.new_elo,
-        date: data.played_at,
-      }),
-    );
-    await batchRecordTeamEloUpdates(teamHistoryUpdates);
-
-    // [>]: Step 9: Prepare and return response.
-    // Convert playersChange to Record<string, EloChange> for response.
+    // [>]: Step 4: Record match, ratings and history atomically.
+    // One pass over the player changes builds both the RPC payload and the
+    // response elo_changes map.
+    const playerChanges: PlayerEloChangeInput[] = [];
     const eloChanges: Record<
       string,
       { old_elo: number; new_elo: number; difference: number }
     > = {};
     for (const [playerIdStr, change] of Object.entries(playersChange)) {
+      playerChanges.push({
+        player_id: Number(playerIdStr),
+        old_elo: change.old_elo,
+        new_elo: change.new_elo,
+      });
       eloChanges[playerIdStr] = {
         old_elo: change.old_elo,
         new_elo: change.new_elo,
         difference: change.difference,
       };
     }
+    const teamChanges = Object.entries(teamsChange).map(
+      ([teamIdStr, change]) => ({
+        team_id: Number(teamIdStr),
+        old_elo: change.old_elo,
+        new_elo: change.new_elo,
+      }),
+    );
+    const matchId = await recordMatchWithElo(
+      {
+        winner_team_id: data.winner_team_id,
+        loser_team_id: data.loser_team_id,
+        played_at: data.played_at,
+        is_fanny: data.is_fanny,
+        notes: data.notes,
+      },
+      playerChanges,
+      teamChanges,
+    );
+
+    // [>]: Step 5: Refresh leaderboard match stats.
+    // [!]: Invalidate only after the refresh: player stats read the view, so
+    // a read in between would re-cache the pre-match counts.
+    await refreshMatchStatsSafely();
+    invalidatePlayerCache(playerChanges.map((change) => change.player_id));
 
+    // [>]: Step 6: Return match with ELO changes.
     return {
       match_id: matchId,
       winner_team_id: data.winner_team_id,
@@ -285,8 +290,19 @@ export async function createNewMatch(
       is_fanny: data.is_fanny,
       played_at: data.played_at,
       notes: data.notes ?? null,
-      winner_team: winnerTeamData,
-      loser_team: loserTeamData,
+      // [>]: Patch the teams fetched in step 2 instead of re-reading them.
+      winner_team: withRecordedElo(
+        winnerTeamData,
+        teamsChange,
+        playersChange,
+        data.played_at,
+      ),
+      loser_team: withRecordedElo(
+        loserTeamData,
+        teamsChange,
+        playersChange,
+        data.played_at,
+      ),
       elo_changes: eloChanges,
     };
   } catch (error) {
@@ -303,99 +319,66 @@ export async function createNewMatch(
 }
 
 // [>]: Get match with player ELO changes.
+// Match, teams and ELO history come back from a single RPC.
 export async function getMatchWithPlayerElo(
   matchId: number,
 ): Promise<MatchWithEloResponse> {
-  const matchData = await getMatchById(matchId);
-
-  // [>]: Get ELO history for this match.
-  const eloHistory = await getPlayersEloHistoryByMatchId(matchId);
-
-  // [>]: Fetch team details.
-  const [winnerTeam, loserTeam] = await Promise.all([
-    getTeam(matchData.winner_team_id),
-    getTeam(matchData.loser_team_id),
-  ]);
-
-  // [>]: Build elo_changes map.
-  const eloChanges: Record<
-    string,
-    { old_elo: number; new_elo: number; difference: number }
-  > = {};
-  for (const eh of eloHistory) {
-    eloChanges[String(eh.player_id)] = {
-      old_elo: eh.old_elo,
-      new_elo: eh.new_elo,
-      difference: eh.difference,
-    };
-  }
-
-  return {
-    match_id: matchData.match_id,
-    winner_team_id: matchData.winner_team_id,
-    loser_team_id: matchData.loser_team_id,
-    is_fanny: matchData.is_fanny,
-    played_at: matchData.played_at,
-    notes: matchData.notes ?? null,
-    winner_team: winnerTeam,
-    loser_team: loserTeam,
-    elo_changes: eloChanges,
-  };
+  const matchData = await getMatchWithEloById(matchId);
+  return mapToMatchWithEloResponse(matchData);
 }
 
 // [>]: Get match with team ELO changes.
 export async function getMatchWithTeamElo(
   matchId: number,
 ): Promise<MatchWithEloResponse> {
-  const matchData = await getMatchById(matchId);
-
-  // [>]: Get team ELO history for this match.
-  const eloHistory = await getTeamsEloHistoryByMatchId(matchId);
-
-  // [>]: Fetch team details.
-  const [winnerTeam, loserTeam] = await Promise.all([
-    getTeam(matchData.winner_team_id),
-    getTeam(matchData.loser_team_id),
-  ]);
-
-  // [>]: Build elo_changes map.
-  const eloChanges: Record<
-    string,
-    { old_elo: number; new_elo: number; difference: number }
-  > = {};
-  for (const eh of eloHistory) {
-    eloChanges[String(eh.team_id)] = {
-      old_elo: eh.old_elo,
-      new_elo: eh.new_elo,
-      difference: eh.difference,
-    };
-  }
-
-  return {
-    match_id: matchData.match_id,
-    winner_team_id: matchData.winner_team_id,
-    loser_team_id: matchData.loser_team_id,
-    is_fanny: matchData.is_fanny,
-    played_at: matchData.played_at,
-    notes: matchData.notes ?? null,
-    winner_team: winnerTeam,
-    loser_team: loserTeam,
-    elo_changes: eloChanges,
-  };
+  const matchData = await getMatchWithEloById(matchId, true);
+  return mapToMatchWithEloResponse(matchData);
 }
 
 // [>]: Delete a match.
 // [!]: Does not reverse ELO changes (matches Python behavior).
 export async function deleteMatch(matchId: number): Promise<void> {
-  // [>]: Verify match exists (throws MatchNotFoundError if not).
-  await getMatchById(matchId);
+  // [>]: ELO history rows are removed by ON DELETE CASCADE.
+  // Throws MatchNotFoundError if no row was deleted.
+  await deleteMatchById(matchId);
 
-  // [>]: Delete ELO history records first to avoid FK constraint violations.
-  await Promise.all([
-    deletePlayerEloHistoryByMatchId(matchId),
-    deleteTeamEloHistoryByMatchId(matchId),
-  ]);
+  // [!]: Invalidate after the refresh so no read re-caches stale view counts.
+  await refreshMatchStatsSafely();
+  invalidatePlayerCache();
+}
 
-  // [>]: Delete the match.
-  await deleteMatchById(matchId);
+// [>]: Refresh leaderboard match stats after a match write.
+// [!]: The match is already committed at this point, so a failed refresh only
+// leaves leaderboards stale until the next write; it must not fail the request.
+async function refreshMatchStatsSafely(): Promise<void> {
+  try {
+    await refreshMatchStats();
+  } catch (error) {
+    console.warn(
+      `Leaderboard stats refresh failed: ${error instanceof Error ? error.message : String(error)}`,
+    );
+  }
+}
+
+// [>]: Apply a just-recorded match's new ratings to a team fetched before it.
+// Mirrors what record_match wrote: team and player global_elo, last_match_at.
+function withRecordedElo(
+  team: TeamResponse,
+  teamsChange: EloChangesMap,
+  playersChange: EloChangesMap,
+  playedAt: string,
+): TeamResponse {
+  return {
+    ...team,
+    global_elo: teamsChange[team.team_id].new_elo,
+    last_match_at: playedAt,
+    player1: team.player1 && {
+      ...team.player1,
+      global_elo: playersChange[team.player1.player_id].new_elo,
+    },
+    player2: team.player2 && {
+      ...team.player2,
+      global_elo: playersChange[team.player2.player_id].new_elo,
+    },
+  };
 }
@@ -4,13 +4,14 @@
 import {
   createPlayer,
   getAllPlayers,
+  getPlayersPage as getPlayersPageRepo,
   getPlayerById,
-  getPlayerByName,
   updatePlayer,
   deletePlayerById,
 } from "@/lib/db/repositories/players";
+import { TtlCache } from "@/lib/db/cache";
 import { getPlayerStats } from "@/lib/db/repositories/stats";
-import { createTeamByPlayerIds } from "@/lib/db/repositories/teams";
+import { createTeamsForPlayer } from "@/lib/db/repositories/teams";
 import { getPlayerEloHistory as getPlayerEloHistoryRepo } from "@/lib/db/repositories/player-elo-history";
 import {
   PlayerAlreadyExistsError,
@@ -25,17 +26,94 @@ import type {
 } from "@/lib/types/schemas/player";
 import type { EloHistoryResponse } from "@/lib/types/schemas/elo-history";
 
+// [>]: Short-lived cache of player lookups by ID.
+// [!]: invalidatePlayerCache only clears this process. Other server instances
+// keep serving a pre-match rating until the entry expires, so the TTL bounds
+// how stale ELO and leaderboard reads can be.
+const PLAYER_CACHE_TTL_MS = 5_000;
+const playerCache = new TtlCache<number, PlayerResponse>({
+  ttlMs: PLAYER_CACHE_TTL_MS,
+});
+
+// [>]: Short-lived cache of the full player list (rankings), single entry.
+const ALL_PLAYERS_KEY = "all";
+const allPlayersCache = new TtlCache<string, PlayerResponse[]>({
+  ttlMs: PLAYER_CACHE_TTL_MS,
+  maxEntries: 1,
+});
+
+// [>]: Very short-lived cache of computed statistics (profile page bursts).
+const PLAYER_STATISTICS_CACHE_TTL_MS = 5_000;
+const statisticsCache = new TtlCache<number, PlayerStatistics>({
+  ttlMs: PLAYER_STATISTICS_CACHE_TTL_MS,
+});
+
+// [>]: Stats of a player with no matches, shared by every new-player response.
+const EMPTY_PLAYER_STATS = Object.freeze({
+  last_match_at: null,
+  matches_played: 0,
+  wins: 0,
+  losses: 0,
+  win_rate: 0,
+});
+
+// [>]: Drop cached players after a write that changes their rating or stats.
+// Without IDs, clears the whole cache (e.g. after deleting a match).
+// Any player write also changes the player list, so that is always cleared.
+export function invalidatePlayerCache(playerIds?: number[]): void {
+  allPlayersCache.clear();
+  if (!playerIds) {
+    playerCache.clear();
+    statisticsCache.clear();
+    return;
+  }
+  for (const playerId of playerIds) {
+    playerCache.delete(playerId);
+    statisticsCache.delete(playerId);
+  }
+}
+
 // [>]: Get a player by ID with full stats.
 // Uses stats repository for computed fields (matches_played, wins, losses, win_rate).
 export async function getPlayer(playerId: number): Promise<PlayerResponse> {
+  const cached = playerCache.get(playerId);
+  if (cached) {
+    return cached;
+  }
+
   const stats = await getPlayerStats(playerId);
-  return mapToPlayerResponse(stats);
+  const player = mapToPlayerResponse(stats);
+  playerCache.set(playerId, player);
+  return player;
 }
 
 // [>]: Get all players with stats for ranking display.
 export async function getAllPlayersWithStats(): Promise<PlayerResponse[]> {
-  const players = await getAllPlayers();
-  return players.map(mapToPlayerResponse);
+  const cached = allPlayersCache.get(ALL_PLAYERS_KEY);
+  if (cached) {
+    return cached;
+  }
+
+  const players = (await getAllPlayers()).map(mapToPlayerResponse);
+  allPlayersCache.set(ALL_PLAYERS_KEY, players);
+  return players;
+}
+
+// [>]: Get one page of players with stats, ordered by player_id.
+// nextCursor is the player_id to pass as `after` for the following page,
+// or null when this is the last page.
+export async function getPlayersPage(options: {
+  limit: number;
+  after?: number;
+}): Promise<{ players: PlayerResponse[]; nextCursor: number | null }> {
+  // [>]: Fetch one extra row to know whether another page exists.
+  const rows = await getPlayersPageRepo(options.limit + 1, options.after);
+  const players = rows.slice(0, options.limit).map(mapToPlayerResponse);
+  const nextCursor =
+    rows.length > options.limit && players.length > 0
+      ? players[players.length - 1].player_id
+      : null;
+  return { players, nextCursor };
 }
 
 // [>]: Create a new player.
@@ -43,32 +121,23 @@ export async function getAllPlayersWithStats(): Promise<PlayerResponse[]> {
 export async function createNewPlayer(
   data: PlayerCreate,
 ): Promise<PlayerResponse> {
-  // [>]: Validate name is not empty.
-  if (!data.name || !data.name.trim()) {
+  // [>]: Normalize once; reject empty names before any database call.
+  const name = data.name?.trim();
+  if (!name) {
     throw new InvalidPlayerDataError(
       "Player name cannot be empty or whitespace only",
     );
   }
 
-  // [>]: Check for existing player with same name.
-  const existingPlayer = await getPlayerByName(data.name);
-  if (existingPlayer) {
-    throw new PlayerAlreadyExistsError(data.name);
-  }
-
   try {
     // [>]: Create the player and get full row data.
-    const playerRow = await createPlayer(data.name, data.global_elo);
+    // The unique index on lower(name) rejects duplicates in the same insert.
+    const playerRow = await createPlayer(name, data.global_elo);
+    invalidatePlayerCache([playerRow.player_id]);
 
     // [>]: Dynamically create teams with all existing players.
-    const allPlayers = await getAllPlayers();
-    for (const existingPlayerRow of allPlayers) {
-      const existingPlayerId = existingPlayerRow.player_id;
-      if (existingPlayerId !== playerRow.player_id) {
-        // [>]: createTeamByPlayerIds handles deduplication and ordering.
-        await createTeamByPlayerIds(playerRow.player_id, existingPlayerId);
-      }
-    }
+    // The pair list is built in SQL from the players table.
+    await createTeamsForPlayer(playerRow.player_id);
 
     // [>]: Return player response with default stats (new player has no matches).
     return {
@@ -76,11 +145,7 @@ export async function createNewPlayer(
       name: playerRow.name,
       global_elo: playerRow.global_elo,
       created_at: playerRow.created_at,
-      last_match_at: null,
-      matches_played: 0,
-      wins: 0,
-      losses: 0,
-      win_rate: 0,
+      ...EMPTY_PLAYER_STATS,
     };
   } catch (error) {
     if (
@@ -101,40 +166,27 @@ export async function updateExistingPlayer(
   playerId: number,
   data: PlayerUpdate,
 ): Promise<PlayerResponse> {
-  // [>]: Verify player exists first (throws PlayerNotFoundError if not).
-  const existingPlayer = await getPlayer(playerId);
-
-  // [>]: If name is being updated, check for conflicts.
-  if (data.name && data.name !== existingPlayer.name) {
-    const conflictPlayer = await getPlayerByName(data.name);
-    if (conflictPlayer && conflictPlayer.player_id !== playerId) {
-      throw new PlayerAlreadyExistsError(data.name);
-    }
-  }
-
-  // [>]: Update the player.
+  // [>]: Update the player (throws PlayerNotFoundError if no row matched,
+  // PlayerAlreadyExistsError if the new name belongs to another player).
   await updatePlayer(playerId, {
     name: data.name,
     global_elo: data.global_elo,
   });
+  invalidatePlayerCache([playerId]);
 
   return await getPlayer(playerId);
 }
 
 // [>]: Delete a player.
-// Verifies existence before deletion.
 export async function deletePlayer(playerId: number): Promise<void> {
   // [>]: Guard against undefined/null playerId.
   if (playerId === undefined || playerId === null) {
     throw new InvalidPlayerDataError("Player ID is required for deletion");
   }
 
-  // [>]: Verify player exists (throws PlayerNotFoundError if not).
-  // Uses getPlayerById instead of getPlayer to avoid RPC dependency.
-  await getPlayerById(playerId);
-
-  // [>]: Delete the player.
+  // [>]: Delete the player (throws PlayerNotFoundError if no row matched).
   await deletePlayerById(playerId);
+  invalidatePlayerCache([playerId]);
 }
 
 // [>]: Get player's ELO history with pagination.
@@ -157,3 +209,111 @@ export async function getPlayerEloHistory(
     date: h.date,
   }));
 }
+
+// [>]: Detailed statistics for the player profile page.
+export interface PlayerStatistics {
+  player_id: number;
+  name: string;
+  global_elo: number;
+  matches_played: number;
+  wins: number;
+  losses: number;
+  win_rate: number;
+  elo_values: number[];
+  elo_difference: number[];
+  average_elo_change: number;
+  highest_elo: number;
+  lowest_elo: number;
+  creation_date: string;
+  recent: {
+    matches_played: number;
+    wins: number;
+    losses: number;
+    win_rate: number;
+    average_elo_change: number;
+    elo_changes: number[];
+  };
+}
+
+// [>]: Get detailed player statistics (ELO chart data, extremes, recent form).
+// Cached briefly per player; match writes invalidate via invalidatePlayerCache.
+export async function getPlayerStatistics(
+  playerId: number,
+): Promise<PlayerStatistics> {
+  const cached = statisticsCache.get(playerId);
+  if (cached) {
+    return cached;
+  }
+
+  // [>]: Get player with basic stats.
+  const player = await getPlayer(playerId);
+
+  // [>]: Get ELO history for chart display (last 100 matches).
+  // [>]: History is ordered by date DESC (newest first).
+  const history = await getPlayerEloHistory(playerId, { limit: 100 });
+
+  // [>]: Extract ELO values and differences from history.
+  const eloValues = history.map((entry) => entry.new_elo);
+  const eloDifference = history.map((entry) => entry.difference);
+
+  // [>]: Calculate additional statistics.
+  let highestElo = player.global_elo;
+  let lowestElo = player.global_elo;
+  let totalEloChange = 0;
+
+  for (const entry of history) {
+    if (entry.new_elo > highestElo) highestElo = entry.new_elo;
+    if (entry.new_elo < lowestElo) lowestElo = entry.new_elo;
+    totalEloChange += entry.difference;
+  }
+
+  const averageEloChange =
+    history.length > 0 ? Math.trunc(totalEloChange / history.length) : 0;
+
+  // [>]: Calculate recent stats from last 10 matches.
+  const recentHistory = history.slice(0, 10);
+  let recentWins = 0;
+  let recentLosses = 0;
+  const recentEloChanges: number[] = [];
+
+  for (const entry of recentHistory) {
+    recentEloChanges.push(entry.difference);
+    if (entry.difference > 0) recentWins++;
+    else if (entry.difference < 0) recentLosses++;
+  }
+
+  const recentMatchesPlayed = recentWins + recentLosses;
+  // [>]: Calculate win rate as decimal (0-1) for consistency with other stats.
+  const recentWinRate =
+    recentMatchesPlayed > 0 ? recentWins / recentMatchesPlayed : 0;
+  const recentAvgEloChange =
+    recentEloChanges.length > 0
+      ? recentEloChanges.reduce((a, b) => a + b, 0) / recentEloChanges.length
+      : 0;
+
+  const statistics: PlayerStatistics = {
+    player_id: player.player_id,
+    name: player.name,
+    global_elo: player.global_elo,
+    matches_played: player.matches_played,
+    wins: player.wins,
+    losses: player.losses,
+    win_rate: player.win_rate,
+    elo_values: eloValues,
+    elo_difference: eloDifference,
+    average_elo_change: averageEloChange,
+    highest_elo: highestElo,
+    lowest_elo: lowestElo,
+    creation_date: player.created_at,
+    recent: {
+      matches_played: recentMatchesPlayed,
+      wins: recentWins,
+      losses: recentLosses,
+      win_rate: recentWinRate,
+      average_elo_change: Math.round(recentAvgEloChange * 100) / 100,
+      elo_changes: recentEloChanges,
+    },
+  };
+  statisticsCache.set(playerId, statistics);
+  return statistics;
+}
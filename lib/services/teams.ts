@@ -9,8 +9,8 @@ import {
   updateTeam,
   deleteTeamById,
 } from "@/lib/db/repositories/teams";
-import { getPlayerById } from "@/lib/db/repositories/players";
-import { getTeamStats } from "@/lib/db/repositories/stats";
+import { getPlayersByIds } from "@/lib/db/repositories/players";
+import { getTeamStats, getTeamsStats } from "@/lib/db/repositories/stats";
 import {
   InvalidTeamDataError,
   TeamOperationError,
@@ -30,6 +30,15 @@ export async function getTeam(teamId: number): Promise<TeamResponse> {
   return mapToTeamResponse(stats);
 }
 
+// [>]: Get several teams by ID with full stats in a single RPC.
+// Returns teams in input order; throws TeamNotFoundError if any is missing.
+export async function getTeamsByIds(
+  teamIds: number[],
+): Promise<TeamResponse[]> {
+  const stats = await getTeamsStats(teamIds);
+  return stats.map(mapToTeamResponse);
+}
+
 // [>]: Get all teams with stats for ranking display.
 export async function getAllTeamsWithStats(options?: {
   skip?: number;
@@ -46,37 +55,30 @@ export async function getTeamsByPlayer(
 ): Promise<TeamResponse[]> {
   // [>]: Get basic team data.
   const teams = await getTeamsByPlayerIdRepo(playerId);
-
-  // [>]: Enrich each team with full stats.
-  const enrichedTeams: TeamResponse[] = [];
-  for (const team of teams) {
-    try {
-      const fullTeam = await getTeam(team.team_id);
-      enrichedTeams.push(fullTeam);
-    } catch {
-      // [>]: If getTeam fails, skip this team (rare edge case).
-      continue;
-    }
+  if (teams.length === 0) {
+    return [];
   }
 
-  return enrichedTeams;
+  // [>]: Enrich all teams with full stats in one batch RPC instead of one
+  // lookup per team. A team deleted in between is skipped, not an error.
+  const teamIds = teams.map((team) => team.team_id);
+  const stats = await getTeamsStats(teamIds, { skipMissing: true });
+  return stats.map(mapToTeamResponse);
 }
 
 // [>]: Create a new team.
 // Validates both players exist.
 export async function createNewTeam(data: TeamCreate): Promise<TeamResponse> {
   try {
-    // [>]: Validate both players exist.
-    const [player1, player2] = await Promise.all([
-      getPlayerById(data.player1_id).catch(() => null),
-      getPlayerById(data.player2_id).catch(() => null),
-    ]);
+    // [>]: Validate both players exist with a single lookup.
+    const players = await getPlayersByIds([data.player1_id, data.player2_id]);
+    const foundIds = new Set(players.map((player) => player.player_id));
 
     const missingPlayers: string[] = [];
-    if (!player1) {
+    if (!foundIds.has(data.player1_id)) {
       missingPlayers.push(String(data.player1_id));
     }
-    if (!player2) {
+    if (!foundIds.has(data.player2_id)) {
       missingPlayers.push(String(data.player2_id));
     }
 
@@ -113,10 +115,7 @@ export async function updateExistingTeam(
   teamId: number,
   data: TeamUpdate,
 ): Promise<TeamResponse> {
-  // [>]: Verify team exists (throws TeamNotFoundError if not).
-  await getTeam(teamId);
-
-  // [>]: Update the team.
+  // [>]: Update the team (throws TeamNotFoundError if no row matched).
   await updateTeam(teamId, {
     global_elo: data.global_elo,
     last_match_at: data.last_match_at,
@@ -127,10 +126,7 @@ export async function updateExistingTeam(
 
 // [>]: Delete a team.
 export async function deleteTeam(teamId: number): Promise<void> {
-  // [>]: Verify team exists (throws TeamNotFoundError if not).
-  await getTeam(teamId);
-
-  // [>]: Delete the team.
+  // [>]: Delete the team (throws TeamNotFoundError if no row matched).
   await deleteTeamById(teamId);
 }
 
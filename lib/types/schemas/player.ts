@@ -1,17 +1,20 @@
 import { z } from "zod";
 
+// [>]: ELO history stores ratings as SMALLINT, so every rating must fit in it.
+export const MAX_ELO = 32767;
+
 // [>]: Base schema defines shared validation rules matching Python Pydantic model.
 
 export const PlayerBaseSchema = z.object({
   name: z.string().min(1).max(100),
-  global_elo: z.number().int().nonnegative().default(1000),
+  global_elo: z.number().int().nonnegative().max(MAX_ELO).default(1000),
 });
 
 export const PlayerCreateSchema = PlayerBaseSchema;
 
 export const PlayerUpdateSchema = z.object({
   name: z.string().min(1).max(100).optional(),
-  global_elo: z.number().int().nonnegative().optional(),
+  global_elo: z.number().int().nonnegative().max(MAX_ELO).optional(),
 });
 
 export const PlayerResponseSchema = PlayerBaseSchema.extend({
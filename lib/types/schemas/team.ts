@@ -1,10 +1,10 @@
 import { z } from "zod";
-import { PlayerResponseSchema } from "./player";
+import { MAX_ELO, PlayerResponseSchema } from "./player";
 
 const TeamBaseSchema = z.object({
   player1_id: z.number().int().positive(),
   player2_id: z.number().int().positive(),
-  global_elo: z.number().int().nonnegative().default(1000),
+  global_elo: z.number().int().nonnegative().max(MAX_ELO).default(1000),
 });
 
 // [>]: Matches Python backend/app/models/team.py validator behavior.
@@ -26,7 +26,7 @@ export const TeamCreateSchema = TeamBaseSchema.refine(
 });
 
 export const TeamUpdateSchema = z.object({
-  global_elo: z.number().int().nonnegative().optional(),
+  global_elo: z.number().int().nonnegative().max(MAX_ELO).optional(),
   last_match_at: z.string().datetime().optional(),
 });
 
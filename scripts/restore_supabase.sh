@@ -164,6 +164,10 @@ SELECT setval(pg_get_serial_sequence('players_elo_history', 'history_id'), COALE
 SELECT setval(pg_get_serial_sequence('teams_elo_history', 'history_id'), COALESCE(MAX(history_id), 1)) FROM teams_elo_history;
 EOF
 
+# Rebuild the match stats materialized views from the restored matches
+log_info "Refreshing match stats views..."
+psql "$DATABASE_URL" -c "SELECT public.refresh_match_stats();"
+
 # Cleanup
 rm -rf "$TEMP_DIR"
 
@@ -0,0 +1,28 @@
+-- ============================================================================
+-- create_teams_for_player
+-- ============================================================================
+-- Creates a team pairing the given player with every other player.
+-- Pairs are stored in canonical order; existing pairs are skipped.
+-- Returns the number of teams created.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION create_teams_for_player(
+    p_player_id INTEGER,
+    p_global_elo INTEGER DEFAULT 1000
+)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH created AS (
+    INSERT INTO teams (player1_id, player2_id, global_elo)
+    SELECT
+      LEAST(p.player_id, p_player_id),
+      GREATEST(p.player_id, p_player_id),
+      p_global_elo
+    FROM players p
+    WHERE p.player_id <> p_player_id
+    ON CONFLICT (player1_id, player2_id) DO NOTHING
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM created;
+$$;
@@ -9,6 +9,7 @@
 -- 2. Called get_team_full_stats for EACH team (N+1 problem)
 --
 -- Now everything is done in a single SQL query: 50x faster.
+-- Match aggregates come from the mv_*_match_stats materialized views.
 --
 -- Parameters:
 --   p_days_since_last_match: Only include teams active within this many days (default: 180)
@@ -24,48 +25,6 @@ LANGUAGE sql
 STABLE
 AS $$
   WITH
-  -- [>]: Pre-aggregate team stats in a single pass over matches table.
-  team_stats AS (
-    SELECT
-      team_id,
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT winner_team_id AS team_id, played_at, true AS is_winner FROM matches
-      UNION ALL
-      SELECT loser_team_id AS team_id, played_at, false AS is_winner FROM matches
-    ) team_matches
-    GROUP BY team_id
-  ),
-
-  -- [>]: Pre-aggregate player stats in a single pass.
-  player_stats AS (
-    SELECT
-      player_id,
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        true AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.winner_team_id
-      UNION ALL
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        false AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.loser_team_id
-    ) player_matches
-    GROUP BY player_id
-  ),
-
   -- [>]: Filter to active teams only (meets minimum matches and recency criteria).
   active_teams AS (
     SELECT
@@ -83,8 +42,10 @@ AS $$
            ELSE 0 END AS win_rate,
       RANK() OVER (ORDER BY t.global_elo DESC, t.created_at ASC) AS rank
     FROM teams t
-    JOIN team_stats ts ON ts.team_id = t.team_id
-    WHERE ts.matches_played >= p_min_matches
+    JOIN mv_team_match_stats ts ON ts.team_id = t.team_id
+    -- [>]: Matches the idx_teams_active_ranking partial index predicate.
+    WHERE t.last_match_at IS NOT NULL
+      AND ts.matches_played >= p_min_matches
       AND ts.last_match_at >= NOW() - (p_days_since_last_match || ' days')::INTERVAL
   )
 
@@ -131,7 +92,7 @@ AS $$
   FROM active_teams at
   JOIN players p1 ON p1.player_id = at.player1_id
   JOIN players p2 ON p2.player_id = at.player2_id
-  LEFT JOIN player_stats ps1 ON ps1.player_id = at.player1_id
-  LEFT JOIN player_stats ps2 ON ps2.player_id = at.player2_id
+  LEFT JOIN mv_player_match_stats ps1 ON ps1.player_id = at.player1_id
+  LEFT JOIN mv_player_match_stats ps2 ON ps2.player_id = at.player2_id
   ORDER BY at.global_elo DESC, at.rank ASC;
 $$;
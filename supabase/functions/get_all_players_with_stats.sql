@@ -3,6 +3,7 @@
 -- ============================================================================
 -- Returns all players with their comprehensive stats using CTEs.
 -- Pre-aggregates stats in a single pass - 41x faster than helper-function approach.
+-- Match aggregates come from the mv_*_match_stats materialized views.
 -- ============================================================================
 
 CREATE OR REPLACE FUNCTION get_all_players_with_stats_optimized()
@@ -10,30 +11,6 @@ RETURNS SETOF jsonb
 LANGUAGE sql
 STABLE
 AS $$
-  WITH player_stats AS (
-    SELECT
-      player_id,
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        true AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.winner_team_id
-      UNION ALL
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        false AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.loser_team_id
-    ) player_matches
-    GROUP BY player_id
-  )
   SELECT jsonb_build_object(
     'player_id', p.player_id,
     'name', p.name,
@@ -49,6 +26,6 @@ AS $$
     'rank', RANK() OVER (ORDER BY p.global_elo DESC, p.created_at ASC)
   )
   FROM players p
-  LEFT JOIN player_stats ps ON ps.player_id = p.player_id
+  LEFT JOIN mv_player_match_stats ps ON ps.player_id = p.player_id
   ORDER BY p.global_elo DESC;
 $$;
@@ -3,6 +3,7 @@
 -- ============================================================================
 -- Returns all teams with their comprehensive stats using CTEs.
 -- Pre-aggregates stats in a single pass - 6x faster than helper-function approach.
+-- Match aggregates come from the mv_*_match_stats materialized views.
 -- ============================================================================
 
 CREATE OR REPLACE FUNCTION get_all_teams_with_stats_optimized(
@@ -14,46 +15,6 @@ LANGUAGE sql
 STABLE
 AS $$
   WITH
-  team_stats AS (
-    SELECT
-      team_id,
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT winner_team_id AS team_id, played_at, true AS is_winner FROM matches
-      UNION ALL
-      SELECT loser_team_id AS team_id, played_at, false AS is_winner FROM matches
-    ) team_matches
-    GROUP BY team_id
-  ),
-
-  player_stats AS (
-    SELECT
-      player_id,
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        true AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.winner_team_id
-      UNION ALL
-      SELECT
-        UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
-        m.played_at,
-        false AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.loser_team_id
-    ) player_matches
-    GROUP BY player_id
-  ),
-
   ranked_teams AS (
     SELECT
       t.team_id,
@@ -70,7 +31,7 @@ AS $$
            ELSE 0 END AS win_rate,
       RANK() OVER (ORDER BY t.global_elo DESC, t.created_at ASC) AS rank
     FROM teams t
-    LEFT JOIN team_stats ts ON ts.team_id = t.team_id
+    LEFT JOIN mv_team_match_stats ts ON ts.team_id = t.team_id
   )
 
   SELECT jsonb_build_object(
@@ -115,8 +76,8 @@ AS $$
   FROM ranked_teams rt
   JOIN players p1 ON p1.player_id = rt.player1_id
   JOIN players p2 ON p2.player_id = rt.player2_id
-  LEFT JOIN player_stats ps1 ON ps1.player_id = rt.player1_id
-  LEFT JOIN player_stats ps2 ON ps2.player_id = rt.player2_id
+  LEFT JOIN mv_player_match_stats ps1 ON ps1.player_id = rt.player1_id
+  LEFT JOIN mv_player_match_stats ps2 ON ps2.player_id = rt.player2_id
   ORDER BY rt.rank ASC, rt.team_id ASC
   OFFSET p_skip
   LIMIT p_limit;
@@ -0,0 +1,50 @@
+-- ============================================================================
+-- get_match_with_elo
+-- ============================================================================
+-- Returns one match with full winner/loser team details and its ELO changes,
+-- keyed by player_id (default) or by team_id when p_by_team is TRUE.
+-- Returns NULL when the match does not exist.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_match_with_elo(
+    p_match_id INTEGER,
+    p_by_team BOOLEAN DEFAULT FALSE
+)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT jsonb_build_object(
+    'match_id', m.match_id,
+    'winner_team_id', m.winner_team_id,
+    'loser_team_id', m.loser_team_id,
+    'is_fanny', m.is_fanny,
+    'played_at', m.played_at,
+    'notes', m.notes,
+    'winner_team', get_team_full_stats_optimized(m.winner_team_id),
+    'loser_team', get_team_full_stats_optimized(m.loser_team_id),
+    'elo_changes', CASE WHEN p_by_team THEN (
+      SELECT COALESCE(jsonb_object_agg(
+        teh.team_id::TEXT, jsonb_build_object(
+          'old_elo', teh.old_elo,
+          'new_elo', teh.new_elo,
+          'difference', teh.difference
+        )
+      ), '{}'::jsonb)
+      FROM teams_elo_history teh
+      WHERE teh.match_id = m.match_id
+    ) ELSE (
+      SELECT COALESCE(jsonb_object_agg(
+        peh.player_id::TEXT, jsonb_build_object(
+          'old_elo', peh.old_elo,
+          'new_elo', peh.new_elo,
+          'difference', peh.difference
+        )
+      ), '{}'::jsonb)
+      FROM players_elo_history peh
+      WHERE peh.match_id = m.match_id
+    ) END
+  )
+  FROM matches m
+  WHERE m.match_id = p_match_id;
+$$;
@@ -0,0 +1,22 @@
+-- ============================================================================
+-- get_player_by_name
+-- ============================================================================
+-- Returns the player whose name matches case-insensitively (zero or one row).
+--
+-- PostgREST filters cannot apply lower(), so name lookups go through this
+-- function. The lower() predicate seeks the unique
+-- idx_players_name_lower_unique index (migration 022), so at most one player
+-- matches.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_player_by_name(p_name VARCHAR)
+RETURNS SETOF players
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT *
+  FROM players
+  WHERE lower(name) = lower(p_name)
+  ORDER BY player_id
+  LIMIT 1;
+$$;
@@ -1,8 +1,9 @@
 -- ============================================================================
 -- get_player_full_stats_optimized
 -- ============================================================================
--- Returns a single player's comprehensive stats using a CTE.
--- Reduces 4 separate queries to 1 aggregated query.
+-- Returns a single player's comprehensive stats.
+-- Reads match aggregates from mv_player_match_stats (refreshed after each
+-- match write by refresh_match_stats()) instead of scanning matches.
 -- ============================================================================
 
 CREATE OR REPLACE FUNCTION get_player_full_stats_optimized(p_player_id INTEGER)
@@ -10,24 +11,6 @@ RETURNS jsonb
 LANGUAGE sql
 STABLE
 AS $$
-  WITH player_stats AS (
-    SELECT
-      COUNT(*) AS matches_played,
-      COUNT(*) FILTER (WHERE is_winner) AS wins,
-      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
-      MAX(played_at) AS last_match_at
-    FROM (
-      SELECT m.played_at, true AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.winner_team_id
-      WHERE t.player1_id = p_player_id OR t.player2_id = p_player_id
-      UNION ALL
-      SELECT m.played_at, false AS is_winner
-      FROM matches m
-      JOIN teams t ON t.team_id = m.loser_team_id
-      WHERE t.player1_id = p_player_id OR t.player2_id = p_player_id
-    ) player_matches
-  )
   SELECT jsonb_build_object(
     'player_id', p.player_id,
     'name', p.name,
@@ -42,6 +25,6 @@ AS $$
     'last_match_at', ps.last_match_at
   )
   FROM players p
-  CROSS JOIN player_stats ps
+  LEFT JOIN mv_player_match_stats ps ON ps.player_id = p.player_id
   WHERE p.player_id = p_player_id;
 $$;
@@ -0,0 +1,36 @@
+-- ============================================================================
+-- get_players_with_stats_page
+-- ============================================================================
+-- Returns one page of players with their stats, ordered by player_id.
+-- Keyset pagination: pass the last player_id of the previous page as
+-- p_after_player_id to get the next page.
+-- Match aggregates come from the mv_player_match_stats materialized view.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_players_with_stats_page(
+    p_limit INTEGER DEFAULT 50,
+    p_after_player_id INTEGER DEFAULT NULL
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT jsonb_build_object(
+    'player_id', p.player_id,
+    'name', p.name,
+    'global_elo', p.global_elo,
+    'created_at', p.created_at,
+    'matches_played', COALESCE(ps.matches_played, 0),
+    'wins', COALESCE(ps.wins, 0),
+    'losses', COALESCE(ps.losses, 0),
+    'win_rate', CASE WHEN COALESCE(ps.matches_played, 0) > 0
+                     THEN ROUND(ps.wins::NUMERIC / ps.matches_played::NUMERIC, 4)
+                     ELSE 0 END,
+    'last_match_at', ps.last_match_at
+  )
+  FROM players p
+  LEFT JOIN mv_player_match_stats ps ON ps.player_id = p.player_id
+  WHERE p_after_player_id IS NULL OR p.player_id > p_after_player_id
+  ORDER BY p.player_id
+  LIMIT p_limit;
+$$;
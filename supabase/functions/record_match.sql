@@ -0,0 +1,51 @@
+-- ============================================================================
+-- record_match
+-- ============================================================================
+-- Inserts a match and applies its precomputed player and team ELO changes
+-- (ratings, team last_match_at and both history tables) in one transaction.
+-- Returns the new match_id.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION record_match(
+    p_winner_team_id INTEGER,
+    p_loser_team_id INTEGER,
+    p_played_at TIMESTAMPTZ,
+    p_is_fanny BOOLEAN,
+    p_notes TEXT,
+    p_player_changes JSONB,
+    p_team_changes JSONB
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_match_id INTEGER;
+BEGIN
+    INSERT INTO matches (winner_team_id, loser_team_id, played_at, is_fanny, notes)
+    VALUES (p_winner_team_id, p_loser_team_id, p_played_at, p_is_fanny, p_notes)
+    RETURNING match_id INTO v_match_id;
+
+    -- [>]: Players: new rating, then one history row each.
+    UPDATE players p
+    SET global_elo = c.new_elo
+    FROM jsonb_to_recordset(p_player_changes) AS c(player_id INTEGER, old_elo INTEGER, new_elo INTEGER)
+    WHERE p.player_id = c.player_id;
+
+    INSERT INTO players_elo_history (player_id, match_id, old_elo, new_elo, difference, date)
+    SELECT c.player_id, v_match_id, c.old_elo, c.new_elo, c.new_elo - c.old_elo, p_played_at
+    FROM jsonb_to_recordset(p_player_changes) AS c(player_id INTEGER, old_elo INTEGER, new_elo INTEGER);
+
+    -- [>]: Teams: new rating and last_match_at, then one history row each.
+    UPDATE teams t
+    SET global_elo = c.new_elo,
+        last_match_at = p_played_at
+    FROM jsonb_to_recordset(p_team_changes) AS c(team_id INTEGER, old_elo INTEGER, new_elo INTEGER)
+    WHERE t.team_id = c.team_id;
+
+    INSERT INTO teams_elo_history (team_id, match_id, old_elo, new_elo, difference, date)
+    SELECT c.team_id, v_match_id, c.old_elo, c.new_elo, c.new_elo - c.old_elo, p_played_at
+    FROM jsonb_to_recordset(p_team_changes) AS c(team_id INTEGER, old_elo INTEGER, new_elo INTEGER);
+
+    RETURN v_match_id;
+END;
+$$;
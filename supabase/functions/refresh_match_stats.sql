@@ -0,0 +1,22 @@
+-- ============================================================================
+-- refresh_match_stats
+-- ============================================================================
+-- Refreshes the mv_player_match_stats and mv_team_match_stats materialized
+-- views read by the leaderboard functions.
+--
+-- Called by the match service after a match is recorded or deleted.
+-- CONCURRENTLY keeps leaderboard reads live during the refresh.
+-- SECURITY DEFINER because only the view owner may refresh it.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION refresh_match_stats()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  REFRESH MATERIALIZED VIEW CONCURRENTLY mv_player_match_stats;
+  REFRESH MATERIALIZED VIEW CONCURRENTLY mv_team_match_stats;
+END;
+$$;
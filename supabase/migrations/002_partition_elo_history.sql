@@ -0,0 +1,197 @@
+-- ============================================
+-- Baby Foot ELO - Partition ELO history tables
+-- Range-partitions players_elo_history and teams_elo_history by year on date
+-- ============================================
+
+-- [>]: Both history tables are append-only time series. Yearly partitions let
+-- date-bounded queries prune to a single partition, and retention becomes a
+-- DROP TABLE instead of a bloat-producing DELETE.
+-- [!]: The partition key must be part of the primary key, so it becomes
+-- (history_id, date). Identity columns on partitioned tables need Postgres 17.
+
+-- ============================================
+-- 1. CREATE PARTITIONED TABLES
+-- ============================================
+
+CREATE TABLE public.players_elo_history_partitioned (
+    history_id INTEGER GENERATED ALWAYS AS IDENTITY,
+    player_id INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    old_elo INTEGER NOT NULL,
+    new_elo INTEGER NOT NULL,
+    difference INTEGER NOT NULL,
+    date TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (history_id, date)
+) PARTITION BY RANGE (date);
+
+CREATE TABLE public.teams_elo_history_partitioned (
+    history_id INTEGER GENERATED ALWAYS AS IDENTITY,
+    team_id INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    old_elo INTEGER NOT NULL,
+    new_elo INTEGER NOT NULL,
+    difference INTEGER NOT NULL,
+    date TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (history_id, date)
+) PARTITION BY RANGE (date);
+
+-- [>]: Default partitions catch rows for years that have no partition yet.
+CREATE TABLE public.players_elo_history_default
+    PARTITION OF public.players_elo_history_partitioned DEFAULT;
+CREATE TABLE public.teams_elo_history_default
+    PARTITION OF public.teams_elo_history_partitioned DEFAULT;
+
+-- ============================================
+-- 2. COPY DATA AND SWAP TABLES
+-- ============================================
+
+INSERT INTO public.players_elo_history_partitioned
+    (history_id, player_id, match_id, old_elo, new_elo, difference, date)
+OVERRIDING SYSTEM VALUE
+SELECT history_id, player_id, match_id, old_elo, new_elo, difference, date
+FROM public.players_elo_history;
+
+INSERT INTO public.teams_elo_history_partitioned
+    (history_id, team_id, match_id, old_elo, new_elo, difference, date)
+OVERRIDING SYSTEM VALUE
+SELECT history_id, team_id, match_id, old_elo, new_elo, difference, date
+FROM public.teams_elo_history;
+
+DROP TABLE public.players_elo_history;
+DROP TABLE public.teams_elo_history;
+
+ALTER TABLE public.players_elo_history_partitioned RENAME TO players_elo_history;
+ALTER TABLE public.teams_elo_history_partitioned RENAME TO teams_elo_history;
+
+SELECT setval(
+    pg_get_serial_sequence('public.players_elo_history', 'history_id'),
+    COALESCE(MAX(history_id), 0) + 1,
+    false
+) FROM public.players_elo_history;
+SELECT setval(
+    pg_get_serial_sequence('public.teams_elo_history', 'history_id'),
+    COALESCE(MAX(history_id), 0) + 1,
+    false
+) FROM public.teams_elo_history;
+
+-- ============================================
+-- 3. FOREIGN KEYS AND INDEXES
+-- ============================================
+
+ALTER TABLE public.players_elo_history
+    ADD CONSTRAINT players_elo_history_player_id_fkey FOREIGN KEY (player_id) REFERENCES public.players(player_id),
+    ADD CONSTRAINT players_elo_history_match_id_fkey FOREIGN KEY (match_id) REFERENCES public.matches(match_id);
+
+ALTER TABLE public.teams_elo_history
+    ADD CONSTRAINT teams_elo_history_team_id_fkey FOREIGN KEY (team_id) REFERENCES public.teams(team_id),
+    ADD CONSTRAINT teams_elo_history_match_id_fkey FOREIGN KEY (match_id) REFERENCES public.matches(match_id);
+
+-- [>]: Indexes on the parent cascade to every partition as local indexes.
+CREATE INDEX idx_players_elohist_player_id ON public.players_elo_history USING btree (player_id);
+CREATE INDEX idx_players_elohist_match_id ON public.players_elo_history USING btree (match_id);
+CREATE INDEX idx_players_elohist_date ON public.players_elo_history USING btree (date);
+
+CREATE INDEX idx_teams_elohist_team_id ON public.teams_elo_history USING btree (team_id);
+CREATE INDEX idx_teams_elohist_match_id ON public.teams_elo_history USING btree (match_id);
+CREATE INDEX idx_teams_elohist_date ON public.teams_elo_history USING btree (date);
+
+-- ============================================
+-- 4. PARTITION MAINTENANCE FUNCTIONS
+-- ============================================
+
+-- Create the yearly partitions of both history tables for p_year.
+-- Rows already routed to the default partition for that year are moved into it.
+CREATE OR REPLACE FUNCTION public.ensure_elo_history_partitions(p_year INTEGER)
+RETURNS void
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_table TEXT;
+    v_partition TEXT;
+    v_from TIMESTAMPTZ := make_timestamptz(p_year, 1, 1, 0, 0, 0, 'UTC');
+    v_to TIMESTAMPTZ := make_timestamptz(p_year + 1, 1, 1, 0, 0, 0, 'UTC');
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY['players_elo_history', 'teams_elo_history'] LOOP
+        v_partition := v_table || '_' || p_year;
+
+        IF to_regclass('public.' || v_partition) IS NOT NULL THEN
+            CONTINUE;
+        END IF;
+
+        -- [>]: A new range partition cannot overlap rows held by the default
+        -- partition, so park them in a temp table while it is created.
+        EXECUTE format(
+            'CREATE TEMP TABLE elo_history_moved ON COMMIT DROP AS
+             WITH moved AS (
+                 DELETE FROM public.%I WHERE date >= %L AND date < %L RETURNING *
+             )
+             SELECT * FROM moved',
+            v_table || '_default', v_from, v_to
+        );
+
+        EXECUTE format(
+            'CREATE TABLE public.%I PARTITION OF public.%I FOR VALUES FROM (%L) TO (%L)',
+            v_partition, v_table, v_from, v_to
+        );
+
+        EXECUTE format(
+            'INSERT INTO public.%I OVERRIDING SYSTEM VALUE SELECT * FROM elo_history_moved',
+            v_table
+        );
+
+        DROP TABLE elo_history_moved;
+    END LOOP;
+END;
+$function$;
+
+-- Drop yearly partitions of both history tables older than p_year.
+-- [!]: Deletes ELO history permanently. Not scheduled; run manually for retention.
+CREATE OR REPLACE FUNCTION public.drop_elo_history_partitions_before(p_year INTEGER)
+RETURNS void
+LANGUAGE plpgsql
+AS $function$
+DECLARE
+    v_partition RECORD;
+BEGIN
+    FOR v_partition IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        JOIN pg_namespace n ON n.oid = p.relnamespace
+        WHERE n.nspname = 'public'
+          AND p.relname IN ('players_elo_history', 'teams_elo_history')
+          AND c.relname ~ '_\d{4}$'
+          AND right(c.relname, 4)::INTEGER < p_year
+    LOOP
+        EXECUTE format('DROP TABLE public.%I', v_partition.relname);
+    END LOOP;
+END;
+$function$;
+
+-- [>]: Maintenance functions are DDL; keep them out of the public API.
+REVOKE EXECUTE ON FUNCTION public.ensure_elo_history_partitions(INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.drop_elo_history_partitions_before(INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- [>]: Create partitions from the oldest recorded year through next year.
+SELECT public.ensure_elo_history_partitions(y::INTEGER)
+FROM generate_series(
+    LEAST(
+        COALESCE((SELECT EXTRACT(YEAR FROM MIN(date) AT TIME ZONE 'UTC') FROM public.players_elo_history), EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC')),
+        COALESCE((SELECT EXTRACT(YEAR FROM MIN(date) AT TIME ZONE 'UTC') FROM public.teams_elo_history), EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC'))
+    ),
+    EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC') + 1
+) AS y;
+
+-- ============================================
+-- 5. GRANT PERMISSIONS (for Supabase API access)
+-- ============================================
+
+GRANT ALL ON TABLE public.players_elo_history TO anon, authenticated, service_role;
+GRANT ALL ON TABLE public.teams_elo_history TO anon, authenticated, service_role;
+
+GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
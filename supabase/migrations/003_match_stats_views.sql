@@ -0,0 +1,266 @@
+-- ============================================
+-- Baby Foot ELO - Match stats materialized views
+-- Precomputes per-player and per-team match aggregates for leaderboard reads
+-- ============================================
+
+-- [>]: The leaderboard RPCs re-aggregated every match on each request.
+-- Match aggregates only change when a match is recorded or deleted, so they
+-- are materialized here and refreshed by the match service after each write.
+-- Player/team rows (name, ELO, rank) are still read live from the base tables.
+
+-- ============================================
+-- 1. CREATE MATERIALIZED VIEWS
+-- ============================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_player_match_stats AS
+SELECT
+  player_id,
+  COUNT(*) AS matches_played,
+  COUNT(*) FILTER (WHERE is_winner) AS wins,
+  COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
+  MAX(played_at) AS last_match_at
+FROM (
+  SELECT
+    UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
+    m.played_at,
+    true AS is_winner
+  FROM public.matches m
+  JOIN public.teams t ON t.team_id = m.winner_team_id
+  UNION ALL
+  SELECT
+    UNNEST(ARRAY[t.player1_id, t.player2_id]) AS player_id,
+    m.played_at,
+    false AS is_winner
+  FROM public.matches m
+  JOIN public.teams t ON t.team_id = m.loser_team_id
+) player_matches
+GROUP BY player_id;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_team_match_stats AS
+SELECT
+  team_id,
+  COUNT(*) AS matches_played,
+  COUNT(*) FILTER (WHERE is_winner) AS wins,
+  COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
+  MAX(played_at) AS last_match_at
+FROM (
+  SELECT winner_team_id AS team_id, played_at, true AS is_winner FROM public.matches
+  UNION ALL
+  SELECT loser_team_id AS team_id, played_at, false AS is_winner FROM public.matches
+) team_matches
+GROUP BY team_id;
+
+-- [>]: Unique indexes are required for REFRESH ... CONCURRENTLY.
+CREATE UNIQUE INDEX idx_mv_player_match_stats_player_id ON public.mv_player_match_stats USING btree (player_id);
+CREATE UNIQUE INDEX idx_mv_team_match_stats_team_id ON public.mv_team_match_stats USING btree (team_id);
+
+-- ============================================
+-- 2. REFRESH FUNCTION
+-- ============================================
+
+-- Refresh match stats views after a match is recorded or deleted.
+-- [>]: CONCURRENTLY keeps leaderboard reads live during the refresh.
+-- SECURITY DEFINER because only the view owner may refresh it.
+CREATE OR REPLACE FUNCTION public.refresh_match_stats()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+BEGIN
+  REFRESH MATERIALIZED VIEW CONCURRENTLY public.mv_player_match_stats;
+  REFRESH MATERIALIZED VIEW CONCURRENTLY public.mv_team_match_stats;
+END;
+$function$;
+
+-- ============================================
+-- 3. READ LEADERBOARDS FROM THE VIEWS
+-- ============================================
+
+-- Get all players with stats (optimized)
+CREATE OR REPLACE FUNCTION public.get_all_players_with_stats_optimized()
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT jsonb_build_object(
+    'player_id', p.player_id,
+    'name', p.name,
+    'global_elo', p.global_elo,
+    'created_at', p.created_at,
+    'matches_played', COALESCE(ps.matches_played, 0),
+    'wins', COALESCE(ps.wins, 0),
+    'losses', COALESCE(ps.losses, 0),
+    'win_rate', CASE WHEN COALESCE(ps.matches_played, 0) > 0
+                     THEN ROUND(ps.wins::NUMERIC / ps.matches_played::NUMERIC, 4)
+                     ELSE 0 END,
+    'last_match_at', ps.last_match_at,
+    'rank', RANK() OVER (ORDER BY p.global_elo DESC, p.created_at ASC)
+  )
+  FROM players p
+  LEFT JOIN public.mv_player_match_stats ps ON ps.player_id = p.player_id
+  ORDER BY p.global_elo DESC;
+$function$;
+
+-- Get all teams with stats (optimized)
+CREATE OR REPLACE FUNCTION public.get_all_teams_with_stats_optimized(p_skip INTEGER DEFAULT 0, p_limit INTEGER DEFAULT 100)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  WITH
+  ranked_teams AS (
+    SELECT
+      t.team_id,
+      t.player1_id,
+      t.player2_id,
+      t.global_elo,
+      t.created_at,
+      COALESCE(ts.matches_played, 0) AS matches_played,
+      COALESCE(ts.wins, 0) AS wins,
+      COALESCE(ts.losses, 0) AS losses,
+      ts.last_match_at,
+      CASE WHEN COALESCE(ts.matches_played, 0) > 0
+           THEN ROUND(ts.wins::NUMERIC / ts.matches_played::NUMERIC, 4)
+           ELSE 0 END AS win_rate,
+      RANK() OVER (ORDER BY t.global_elo DESC, t.created_at ASC) AS rank
+    FROM teams t
+    LEFT JOIN public.mv_team_match_stats ts ON ts.team_id = t.team_id
+  )
+  SELECT jsonb_build_object(
+    'team_id', rt.team_id,
+    'player1_id', rt.player1_id,
+    'player2_id', rt.player2_id,
+    'global_elo', rt.global_elo,
+    'created_at', rt.created_at,
+    'matches_played', rt.matches_played,
+    'wins', rt.wins,
+    'losses', rt.losses,
+    'win_rate', rt.win_rate,
+    'last_match_at', rt.last_match_at,
+    'rank', rt.rank,
+    'player1', jsonb_build_object(
+      'player_id', p1.player_id,
+      'name', p1.name,
+      'global_elo', p1.global_elo,
+      'created_at', p1.created_at,
+      'matches_played', COALESCE(ps1.matches_played, 0),
+      'wins', COALESCE(ps1.wins, 0),
+      'losses', COALESCE(ps1.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps1.matches_played, 0) > 0
+                       THEN ROUND(ps1.wins::NUMERIC / ps1.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps1.last_match_at
+    ),
+    'player2', jsonb_build_object(
+      'player_id', p2.player_id,
+      'name', p2.name,
+      'global_elo', p2.global_elo,
+      'created_at', p2.created_at,
+      'matches_played', COALESCE(ps2.matches_played, 0),
+      'wins', COALESCE(ps2.wins, 0),
+      'losses', COALESCE(ps2.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps2.matches_played, 0) > 0
+                       THEN ROUND(ps2.wins::NUMERIC / ps2.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps2.last_match_at
+    )
+  )
+  FROM ranked_teams rt
+  JOIN players p1 ON p1.player_id = rt.player1_id
+  JOIN players p2 ON p2.player_id = rt.player2_id
+  LEFT JOIN public.mv_player_match_stats ps1 ON ps1.player_id = rt.player1_id
+  LEFT JOIN public.mv_player_match_stats ps2 ON ps2.player_id = rt.player2_id
+  ORDER BY rt.rank ASC, rt.team_id ASC
+  OFFSET p_skip
+  LIMIT p_limit;
+$function$;
+
+-- Get active teams with stats (batch - replaces N+1 pattern)
+CREATE OR REPLACE FUNCTION public.get_active_teams_with_stats_batch(
+  p_days_since_last_match INTEGER DEFAULT 180,
+  p_min_matches INTEGER DEFAULT 10
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  WITH
+  active_teams AS (
+    SELECT
+      t.team_id,
+      t.player1_id,
+      t.player2_id,
+      t.global_elo,
+      t.created_at,
+      ts.matches_played,
+      ts.wins,
+      ts.losses,
+      ts.last_match_at,
+      CASE WHEN ts.matches_played > 0
+           THEN ROUND(ts.wins::NUMERIC / ts.matches_played::NUMERIC, 4)
+           ELSE 0 END AS win_rate,
+      RANK() OVER (ORDER BY t.global_elo DESC, t.created_at ASC) AS rank
+    FROM teams t
+    JOIN public.mv_team_match_stats ts ON ts.team_id = t.team_id
+    WHERE ts.matches_played >= p_min_matches
+      AND ts.last_match_at >= NOW() - (p_days_since_last_match || ' days')::INTERVAL
+  )
+  SELECT jsonb_build_object(
+    'team_id', at.team_id,
+    'player1_id', at.player1_id,
+    'player2_id', at.player2_id,
+    'global_elo', at.global_elo,
+    'created_at', at.created_at,
+    'matches_played', at.matches_played,
+    'wins', at.wins,
+    'losses', at.losses,
+    'win_rate', at.win_rate,
+    'last_match_at', at.last_match_at,
+    'rank', at.rank,
+    'player1', jsonb_build_object(
+      'player_id', p1.player_id,
+      'name', p1.name,
+      'global_elo', p1.global_elo,
+      'created_at', p1.created_at,
+      'matches_played', COALESCE(ps1.matches_played, 0),
+      'wins', COALESCE(ps1.wins, 0),
+      'losses', COALESCE(ps1.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps1.matches_played, 0) > 0
+                       THEN ROUND(ps1.wins::NUMERIC / ps1.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps1.last_match_at
+    ),
+    'player2', jsonb_build_object(
+      'player_id', p2.player_id,
+      'name', p2.name,
+      'global_elo', p2.global_elo,
+      'created_at', p2.created_at,
+      'matches_played', COALESCE(ps2.matches_played, 0),
+      'wins', COALESCE(ps2.wins, 0),
+      'losses', COALESCE(ps2.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps2.matches_played, 0) > 0
+                       THEN ROUND(ps2.wins::NUMERIC / ps2.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps2.last_match_at
+    )
+  )
+  FROM active_teams at
+  JOIN players p1 ON p1.player_id = at.player1_id
+  JOIN players p2 ON p2.player_id = at.player2_id
+  LEFT JOIN public.mv_player_match_stats ps1 ON ps1.player_id = at.player1_id
+  LEFT JOIN public.mv_player_match_stats ps2 ON ps2.player_id = at.player2_id
+  ORDER BY at.global_elo DESC, at.rank ASC;
+$function$;
+
+-- ============================================
+-- 4. GRANT PERMISSIONS (for Supabase API access)
+-- ============================================
+
+GRANT SELECT ON TABLE public.mv_player_match_stats TO anon, authenticated, service_role;
+GRANT SELECT ON TABLE public.mv_team_match_stats TO anon, authenticated, service_role;
+GRANT EXECUTE ON FUNCTION public.refresh_match_stats() TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,20 @@
+-- ============================================
+-- Baby Foot ELO - Ranking indexes
+-- Indexes matching the leaderboard ORDER BY so rankings avoid a full sort
+-- ============================================
+
+-- [>]: Leaderboard RPCs rank with RANK() OVER (ORDER BY global_elo DESC, created_at ASC).
+-- Leading the index with the same keys lets the planner walk it in rank order,
+-- and the INCLUDE columns keep the scan index-only for the ranking columns.
+
+CREATE INDEX IF NOT EXISTS idx_players_ranking
+    ON public.players USING btree (global_elo DESC, created_at ASC)
+    INCLUDE (player_id, name);
+
+CREATE INDEX IF NOT EXISTS idx_teams_ranking
+    ON public.teams USING btree (global_elo DESC, created_at ASC)
+    INCLUDE (team_id, player1_id, player2_id);
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,25 @@
+-- ============================================
+-- Baby Foot ELO - Covering index for team pair lookups
+-- Makes the player-pair lookup done on every team creation index-only
+-- ============================================
+
+-- [>]: The repository normalizes pairs (player1_id < player2_id) and looks teams
+-- up with player1_id = ? AND player2_id = ?, which uses idx_teams_players rather
+-- than the LEAST/GREATEST expression index. Covering the selected columns
+-- removes the heap fetch per lookup.
+CREATE INDEX IF NOT EXISTS idx_teams_players_cover
+    ON public.teams USING btree (player1_id, player2_id)
+    INCLUDE (team_id, global_elo, created_at, last_match_at);
+
+DROP INDEX IF EXISTS public.idx_teams_players;
+
+-- [>]: idx_teams_player1_id is a prefix of idx_teams_players_cover and only adds
+-- write amplification. idx_teams_player2_id is kept for the player1/player2 OR
+-- lookup in getTeamsByPlayerId.
+DROP INDEX IF EXISTS public.idx_teams_player1_id;
+
+-- [>]: idx_teams_player_pair_order_insensitive stays as the uniqueness guarantee.
+
+-- ============================================
+-- Migration complete!
+-- ============================================
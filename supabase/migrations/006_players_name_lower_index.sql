@@ -0,0 +1,36 @@
+-- ============================================
+-- Baby Foot ELO - Functional index on lower(name)
+-- Replaces the raw name index with one usable for case-insensitive lookups
+-- ============================================
+
+-- [>]: text_pattern_ops (lower() returns text) also serves prefix searches
+-- such as lower(name) LIKE 'pre%'.
+CREATE INDEX IF NOT EXISTS idx_players_name_lower
+    ON public.players USING btree (lower(name) text_pattern_ops);
+
+DROP INDEX IF EXISTS public.idx_players_name;
+
+-- ============================================
+-- Name lookup through the functional index
+-- ============================================
+
+-- Get a player by exact name.
+-- [>]: PostgREST filters cannot apply lower(), so the lookup goes through this
+-- function. The lower() predicate seeks idx_players_name_lower; the exact
+-- comparison keeps case-sensitive semantics.
+CREATE OR REPLACE FUNCTION public.get_player_by_name(p_name VARCHAR)
+RETURNS SETOF public.players
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT *
+  FROM players
+  WHERE lower(name) = lower(p_name)
+    AND name = p_name;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_player_by_name(VARCHAR) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,21 @@
+-- ============================================
+-- Baby Foot ELO - Narrow player ELO history columns
+-- Stores player ELO history values as SMALLINT
+-- ============================================
+
+-- [>]: Player ELO ratings and per-match deltas fit comfortably in 16 bits.
+-- Halving these three columns packs more history rows per page for the
+-- progression and statistics scans. ALTER on the partitioned parent
+-- rewrites every partition.
+ALTER TABLE public.players_elo_history
+    ALTER COLUMN old_elo TYPE SMALLINT USING old_elo::SMALLINT,
+    ALTER COLUMN new_elo TYPE SMALLINT USING new_elo::SMALLINT,
+    ALTER COLUMN difference TYPE SMALLINT USING difference::SMALLINT;
+
+ALTER TABLE public.players_elo_history
+    ADD CONSTRAINT players_elo_history_old_elo_check CHECK (old_elo >= 0),
+    ADD CONSTRAINT players_elo_history_new_elo_check CHECK (new_elo >= 0);
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,28 @@
+-- ============================================
+-- Baby Foot ELO - Canonical team pair order
+-- Enforces player1_id < player2_id so a plain unique index covers pair uniqueness
+-- ============================================
+
+-- [>]: The repository already inserts pairs in canonical order; swap any legacy
+-- rows that predate normalization so the CHECK can be added.
+UPDATE public.teams
+SET player1_id = player2_id,
+    player2_id = player1_id
+WHERE player1_id > player2_id;
+
+ALTER TABLE public.teams
+    ADD CONSTRAINT teams_player_order_check CHECK (player1_id < player2_id);
+
+-- [>]: With canonical order, (player1_id, player2_id) uniqueness is equivalent to
+-- order-insensitive uniqueness. The constraint keeps the covering columns so
+-- pair lookups stay index-only.
+ALTER TABLE public.teams
+    ADD CONSTRAINT teams_player_pair_key UNIQUE (player1_id, player2_id)
+    INCLUDE (team_id, global_elo, created_at, last_match_at);
+
+DROP INDEX IF EXISTS public.idx_teams_players_cover;
+DROP INDEX IF EXISTS public.idx_teams_player_pair_order_insensitive;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
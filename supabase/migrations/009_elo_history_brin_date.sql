@@ -0,0 +1,19 @@
+-- ============================================
+-- Baby Foot ELO - BRIN indexes on ELO history dates
+-- Replaces the date btree indexes with BRIN for time-range scans
+-- ============================================
+
+-- [>]: History rows are appended in roughly date order, so per-range min/max
+-- summaries are enough to skip heap ranges. Partition pruning skips whole
+-- years; BRIN skips ranges within a partition at a fraction of a btree's size.
+CREATE INDEX IF NOT EXISTS brin_players_elohist_date
+    ON public.players_elo_history USING brin (date) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS brin_teams_elohist_date
+    ON public.teams_elo_history USING brin (date) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS public.idx_players_elohist_date;
+DROP INDEX IF EXISTS public.idx_teams_elohist_date;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
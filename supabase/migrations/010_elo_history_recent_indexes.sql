@@ -0,0 +1,22 @@
+-- ============================================
+-- Baby Foot ELO - Recent ELO history indexes
+-- Serves "latest history for this player/team" as an ordered index scan
+-- ============================================
+
+-- [>]: History endpoints run WHERE player_id = ? ORDER BY date DESC with a range.
+-- A (player_id, date DESC) index returns rows already ordered, so LIMIT stops
+-- early instead of filtering then sorting the whole per-entity history.
+CREATE INDEX IF NOT EXISTS idx_players_elohist_player_recent
+    ON public.players_elo_history USING btree (player_id, date DESC)
+    INCLUDE (match_id, old_elo, new_elo, difference);
+CREATE INDEX IF NOT EXISTS idx_teams_elohist_team_recent
+    ON public.teams_elo_history USING btree (team_id, date DESC)
+    INCLUDE (match_id, old_elo, new_elo, difference);
+
+-- [>]: The single-column indexes are prefixes of the new ones.
+DROP INDEX IF EXISTS public.idx_players_elohist_player_id;
+DROP INDEX IF EXISTS public.idx_teams_elohist_team_id;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,96 @@
+-- ============================================
+-- Baby Foot ELO - Partial index on teams that have played
+-- Keeps the active team ranking index limited to the hot subset of teams
+-- ============================================
+
+-- [>]: A team is auto-created for every pair of players, so most rows never
+-- play a match. Team rankings only consider teams with recent matches, and the
+-- match service stamps last_match_at on every team it records a match for.
+CREATE INDEX IF NOT EXISTS idx_teams_active_ranking
+    ON public.teams USING btree (global_elo DESC, created_at ASC)
+    INCLUDE (team_id, player1_id, player2_id)
+    WHERE last_match_at IS NOT NULL;
+
+-- Get active teams with stats (batch - replaces N+1 pattern)
+-- [>]: last_match_at IS NOT NULL matches the partial index predicate so the
+-- planner can start from teams that have played instead of every pair.
+CREATE OR REPLACE FUNCTION public.get_active_teams_with_stats_batch(
+  p_days_since_last_match INTEGER DEFAULT 180,
+  p_min_matches INTEGER DEFAULT 10
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  WITH
+  active_teams AS (
+    SELECT
+      t.team_id,
+      t.player1_id,
+      t.player2_id,
+      t.global_elo,
+      t.created_at,
+      ts.matches_played,
+      ts.wins,
+      ts.losses,
+      ts.last_match_at,
+      CASE WHEN ts.matches_played > 0
+           THEN ROUND(ts.wins::NUMERIC / ts.matches_played::NUMERIC, 4)
+           ELSE 0 END AS win_rate,
+      RANK() OVER (ORDER BY t.global_elo DESC, t.created_at ASC) AS rank
+    FROM teams t
+    JOIN public.mv_team_match_stats ts ON ts.team_id = t.team_id
+    WHERE t.last_match_at IS NOT NULL
+      AND ts.matches_played >= p_min_matches
+      AND ts.last_match_at >= NOW() - (p_days_since_last_match || ' days')::INTERVAL
+  )
+  SELECT jsonb_build_object(
+    'team_id', at.team_id,
+    'player1_id', at.player1_id,
+    'player2_id', at.player2_id,
+    'global_elo', at.global_elo,
+    'created_at', at.created_at,
+    'matches_played', at.matches_played,
+    'wins', at.wins,
+    'losses', at.losses,
+    'win_rate', at.win_rate,
+    'last_match_at', at.last_match_at,
+    'rank', at.rank,
+    'player1', jsonb_build_object(
+      'player_id', p1.player_id,
+      'name', p1.name,
+      'global_elo', p1.global_elo,
+      'created_at', p1.created_at,
+      'matches_played', COALESCE(ps1.matches_played, 0),
+      'wins', COALESCE(ps1.wins, 0),
+      'losses', COALESCE(ps1.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps1.matches_played, 0) > 0
+                       THEN ROUND(ps1.wins::NUMERIC / ps1.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps1.last_match_at
+    ),
+    'player2', jsonb_build_object(
+      'player_id', p2.player_id,
+      'name', p2.name,
+      'global_elo', p2.global_elo,
+      'created_at', p2.created_at,
+      'matches_played', COALESCE(ps2.matches_played, 0),
+      'wins', COALESCE(ps2.wins, 0),
+      'losses', COALESCE(ps2.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps2.matches_played, 0) > 0
+                       THEN ROUND(ps2.wins::NUMERIC / ps2.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps2.last_match_at
+    )
+  )
+  FROM active_teams at
+  JOIN players p1 ON p1.player_id = at.player1_id
+  JOIN players p2 ON p2.player_id = at.player2_id
+  LEFT JOIN public.mv_player_match_stats ps1 ON ps1.player_id = at.player1_id
+  LEFT JOIN public.mv_player_match_stats ps2 ON ps2.player_id = at.player2_id
+  ORDER BY at.global_elo DESC, at.rank ASC;
+$function$;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
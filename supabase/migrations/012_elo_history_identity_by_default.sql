@@ -0,0 +1,17 @@
+-- ============================================
+-- Baby Foot ELO - ELO history identity BY DEFAULT
+-- Lets bulk imports supply history IDs without OVERRIDING SYSTEM VALUE
+-- ============================================
+
+-- [>]: History rows are only ever appended in bulk (4 player rows and 2 team
+-- rows per match in one INSERT, or whole tables during restores). BY DEFAULT
+-- keeps generated IDs for normal inserts while allowing batched imports to
+-- provide their own IDs instead of serializing on nextval.
+ALTER TABLE public.players_elo_history
+    ALTER COLUMN history_id SET GENERATED BY DEFAULT;
+ALTER TABLE public.teams_elo_history
+    ALTER COLUMN history_id SET GENERATED BY DEFAULT;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,17 @@
+-- ============================================
+-- Baby Foot ELO - Identity sequence caching
+-- Pre-allocates ID blocks per session for bulk-inserted tables
+-- ============================================
+
+-- [>]: Each session grabs a block of IDs instead of touching the sequence for
+-- every row. Only tables written in bulk are cached: ELO history (6 rows per
+-- match) and teams (one row per existing player on registration).
+-- [!]: Cached IDs leave gaps after restarts and are not ordered across
+-- sessions. Nothing orders by these IDs except as a tie-breaker.
+ALTER TABLE public.players_elo_history ALTER COLUMN history_id SET CACHE 100;
+ALTER TABLE public.teams_elo_history ALTER COLUMN history_id SET CACHE 100;
+ALTER TABLE public.teams ALTER COLUMN team_id SET CACHE 100;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,21 @@
+-- ============================================
+-- Baby Foot ELO - Narrow team ELO history columns
+-- Stores team ELO history values as SMALLINT
+-- ============================================
+
+-- [>]: Team ELO is an integer rating like player ELO, so no scaled encoding is
+-- needed: old/new ratings and per-match deltas fit in 16 bits as-is. Mirrors
+-- 007 for players and halves these columns in every team history partition
+-- and in the INCLUDE payload of idx_teams_elohist_team_recent.
+ALTER TABLE public.teams_elo_history
+    ALTER COLUMN old_elo TYPE SMALLINT USING old_elo::SMALLINT,
+    ALTER COLUMN new_elo TYPE SMALLINT USING new_elo::SMALLINT,
+    ALTER COLUMN difference TYPE SMALLINT USING difference::SMALLINT;
+
+ALTER TABLE public.teams_elo_history
+    ADD CONSTRAINT teams_elo_history_old_elo_check CHECK (old_elo >= 0),
+    ADD CONSTRAINT teams_elo_history_new_elo_check CHECK (new_elo >= 0);
+
+-- ============================================
+-- Migration complete!
+-- ============================================
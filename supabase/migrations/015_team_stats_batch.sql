@@ -0,0 +1,122 @@
+-- ============================================
+-- Baby Foot ELO - Batch team stats lookup
+-- Resolves full stats for several teams in one call
+-- ============================================
+
+-- [>]: Match detail and creation paths need both the winner and the loser
+-- team. Fetching them through get_team_full_stats_optimized costs one round
+-- trip per team, and each call aggregates stats for every player in the
+-- database. This function returns the same JSON shape for a set of teams and
+-- aggregates only the teams and players involved.
+
+-- Get full stats for a set of teams, one jsonb row per existing team.
+-- Unknown IDs are skipped; callers detect missing teams by team_id.
+CREATE OR REPLACE FUNCTION public.get_teams_full_stats_batch(p_team_ids INTEGER[])
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  WITH
+  requested_teams AS (
+    SELECT t.*
+    FROM teams t
+    WHERE t.team_id = ANY(p_team_ids)
+  ),
+
+  team_stats AS (
+    SELECT
+      team_id,
+      COUNT(*) AS matches_played,
+      COUNT(*) FILTER (WHERE is_winner) AS wins,
+      COUNT(*) FILTER (WHERE NOT is_winner) AS losses,
+      MAX(played_at) AS last_match_at
+    FROM (
+      SELECT winner_team_id AS team_id, played_at, true AS is_winner
+      FROM matches WHERE winner_team_id = ANY(p_team_ids)
+      UNION ALL
+      SELECT loser_team_id AS team_id, played_at, false AS is_winner
+      FROM matches WHERE loser_team_id = ANY(p_team_ids)
+    ) team_matches
+    GROUP BY team_id
+  ),
+
+  -- [>]: Every team any requested player belongs to; player stats span all of them.
+  player_teams AS (
+    SELECT rp.player_id, t.team_id
+    FROM (
+      SELECT player1_id AS player_id FROM requested_teams
+      UNION
+      SELECT player2_id FROM requested_teams
+    ) rp
+    JOIN teams t ON t.player1_id = rp.player_id OR t.player2_id = rp.player_id
+  ),
+
+  player_stats AS (
+    SELECT
+      pt.player_id,
+      COUNT(*) AS matches_played,
+      COUNT(*) FILTER (WHERE pm.is_winner) AS wins,
+      COUNT(*) FILTER (WHERE NOT pm.is_winner) AS losses,
+      MAX(pm.played_at) AS last_match_at
+    FROM player_teams pt
+    JOIN (
+      SELECT winner_team_id AS team_id, played_at, true AS is_winner FROM matches
+      UNION ALL
+      SELECT loser_team_id AS team_id, played_at, false AS is_winner FROM matches
+    ) pm ON pm.team_id = pt.team_id
+    GROUP BY pt.player_id
+  )
+
+  SELECT jsonb_build_object(
+    'team_id', t.team_id,
+    'player1_id', t.player1_id,
+    'player2_id', t.player2_id,
+    'global_elo', t.global_elo,
+    'created_at', t.created_at,
+    'matches_played', COALESCE(ts.matches_played, 0),
+    'wins', COALESCE(ts.wins, 0),
+    'losses', COALESCE(ts.losses, 0),
+    'win_rate', CASE WHEN COALESCE(ts.matches_played, 0) > 0
+                     THEN ROUND(ts.wins::NUMERIC / ts.matches_played::NUMERIC, 4)
+                     ELSE 0 END,
+    'last_match_at', ts.last_match_at,
+    'player1', jsonb_build_object(
+      'player_id', p1.player_id,
+      'name', p1.name,
+      'global_elo', p1.global_elo,
+      'created_at', p1.created_at,
+      'matches_played', COALESCE(ps1.matches_played, 0),
+      'wins', COALESCE(ps1.wins, 0),
+      'losses', COALESCE(ps1.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps1.matches_played, 0) > 0
+                       THEN ROUND(ps1.wins::NUMERIC / ps1.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps1.last_match_at
+    ),
+    'player2', jsonb_build_object(
+      'player_id', p2.player_id,
+      'name', p2.name,
+      'global_elo', p2.global_elo,
+      'created_at', p2.created_at,
+      'matches_played', COALESCE(ps2.matches_played, 0),
+      'wins', COALESCE(ps2.wins, 0),
+      'losses', COALESCE(ps2.losses, 0),
+      'win_rate', CASE WHEN COALESCE(ps2.matches_played, 0) > 0
+                       THEN ROUND(ps2.wins::NUMERIC / ps2.matches_played::NUMERIC, 4)
+                       ELSE 0 END,
+      'last_match_at', ps2.last_match_at
+    )
+  )
+  FROM requested_teams t
+  LEFT JOIN team_stats ts ON ts.team_id = t.team_id
+  JOIN players p1 ON p1.player_id = t.player1_id
+  JOIN players p2 ON p2.player_id = t.player2_id
+  LEFT JOIN player_stats ps1 ON ps1.player_id = t.player1_id
+  LEFT JOIN player_stats ps2 ON ps2.player_id = t.player2_id;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_teams_full_stats_batch(INTEGER[]) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,32 @@
+-- ============================================
+-- Baby Foot ELO - Team/date composite indexes on matches
+-- Lets per-team match stats read (team_id, played_at) straight from an index
+-- ============================================
+
+-- [>]: The match list RPCs aggregate stats per involved team with
+-- "WHERE winner_team_id IN (...)" / "WHERE loser_team_id IN (...)" and read
+-- only the team id and played_at (COUNT, MAX(played_at)). With played_at in
+-- the key these become index-only scans instead of heap fetches per match,
+-- and a team's matches come back already in played_at order.
+CREATE INDEX IF NOT EXISTS idx_matches_winner_played
+    ON public.matches USING btree (winner_team_id, played_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_matches_loser_played
+    ON public.matches USING btree (loser_team_id, played_at DESC);
+
+-- [>]: The single-column team indexes are now leading prefixes of the
+-- composites above (and winner_team_id also of idx_matches_winner_loser_played),
+-- so they only add write cost on every match insert.
+DROP INDEX IF EXISTS public.idx_matches_winner_team_id;
+DROP INDEX IF EXISTS public.idx_matches_loser_team_id;
+
+-- [>]: Fanny matches are a small subset. A partial index keeps the
+-- "is_fanny = true ORDER BY played_at DESC LIMIT n" listing from walking the
+-- whole played_at index and discarding most rows.
+CREATE INDEX IF NOT EXISTS idx_matches_fanny_played_at
+    ON public.matches USING btree (played_at DESC)
+    WHERE is_fanny;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
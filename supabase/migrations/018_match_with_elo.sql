@@ -0,0 +1,58 @@
+-- ============================================
+-- Baby Foot ELO - Match detail with ELO changes in one call
+-- Returns a match, both teams and its ELO changes as a single JSON object
+-- ============================================
+
+-- [>]: The match detail endpoints fetched the match row and its ELO history,
+-- then both teams in a second round trip. This function builds the whole
+-- response shape in the database. Returns NULL when the match does not exist.
+-- p_by_team = FALSE: elo_changes keyed by player_id (players_elo_history)
+-- p_by_team = TRUE:  elo_changes keyed by team_id (teams_elo_history)
+CREATE OR REPLACE FUNCTION public.get_match_with_elo(
+    p_match_id INTEGER,
+    p_by_team BOOLEAN DEFAULT FALSE
+)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT jsonb_build_object(
+    'match_id', m.match_id,
+    'winner_team_id', m.winner_team_id,
+    'loser_team_id', m.loser_team_id,
+    'is_fanny', m.is_fanny,
+    'played_at', m.played_at,
+    'notes', m.notes,
+    'winner_team', public.get_team_full_stats_optimized(m.winner_team_id),
+    'loser_team', public.get_team_full_stats_optimized(m.loser_team_id),
+    'elo_changes', CASE WHEN p_by_team THEN (
+      SELECT COALESCE(jsonb_object_agg(
+        teh.team_id::TEXT, jsonb_build_object(
+          'old_elo', teh.old_elo,
+          'new_elo', teh.new_elo,
+          'difference', teh.difference
+        )
+      ), '{}'::jsonb)
+      FROM teams_elo_history teh
+      WHERE teh.match_id = m.match_id
+    ) ELSE (
+      SELECT COALESCE(jsonb_object_agg(
+        peh.player_id::TEXT, jsonb_build_object(
+          'old_elo', peh.old_elo,
+          'new_elo', peh.new_elo,
+          'difference', peh.difference
+        )
+      ), '{}'::jsonb)
+      FROM players_elo_history peh
+      WHERE peh.match_id = m.match_id
+    ) END
+  )
+  FROM matches m
+  WHERE m.match_id = p_match_id;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_match_with_elo(INTEGER, BOOLEAN) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,20 @@
+-- ============================================
+-- Baby Foot ELO - Cascade match deletes to ELO history
+-- Lets a match delete remove its history rows in the same statement
+-- ============================================
+
+-- [>]: Deleting a match used to take four round trips: an existence check,
+-- two history deletes (to satisfy these foreign keys), then the match delete.
+-- With ON DELETE CASCADE a single DELETE on matches removes the history rows
+-- atomically, and its row count doubles as the existence check.
+ALTER TABLE public.players_elo_history
+    DROP CONSTRAINT players_elo_history_match_id_fkey,
+    ADD CONSTRAINT players_elo_history_match_id_fkey FOREIGN KEY (match_id) REFERENCES public.matches(match_id) ON DELETE CASCADE;
+
+ALTER TABLE public.teams_elo_history
+    DROP CONSTRAINT teams_elo_history_match_id_fkey,
+    ADD CONSTRAINT teams_elo_history_match_id_fkey FOREIGN KEY (match_id) REFERENCES public.matches(match_id) ON DELETE CASCADE;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
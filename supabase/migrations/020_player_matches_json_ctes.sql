@@ -0,0 +1,150 @@
+-- ============================================
+-- Baby Foot ELO - Player match history without per-row team counts
+-- Pre-aggregates team stats once per page instead of per match
+-- ============================================
+
+-- [>]: get_player_matches_json computed each team's matches_played, wins,
+-- losses and win_rate with eight correlated COUNT subqueries per match row
+-- (sixteen per match for both teams), each a scan of matches. The page is now
+-- selected first, stats for its teams are aggregated in one pass and joined
+-- back, as in get_all_matches_with_details. Output shape is unchanged.
+CREATE OR REPLACE FUNCTION public.get_player_matches_json(
+    p_player_id BIGINT,
+    p_start_date TIMESTAMP DEFAULT NULL,
+    p_end_date TIMESTAMP DEFAULT NULL,
+    p_is_fanny BOOLEAN DEFAULT NULL,
+    p_limit INTEGER DEFAULT 10,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $function$
+WITH
+-- Step 1: Page of the player's matches (limits scope of all subsequent CTEs).
+target_matches AS (
+  SELECT
+    m.match_id, m.played_at, m.is_fanny, m.notes,
+    m.winner_team_id, m.loser_team_id,
+    peh.old_elo, peh.new_elo, peh.difference
+  FROM players_elo_history peh
+  JOIN matches m ON peh.match_id = m.match_id
+  WHERE peh.player_id = p_player_id
+    AND (p_start_date IS NULL OR m.played_at >= p_start_date)
+    AND (p_end_date IS NULL OR m.played_at <= p_end_date)
+    AND (p_is_fanny IS NULL OR m.is_fanny = p_is_fanny)
+  ORDER BY m.played_at DESC
+  LIMIT p_limit
+  OFFSET p_offset
+),
+
+-- Step 2: Collect unique team IDs from target matches.
+involved_team_ids AS (
+  SELECT winner_team_id AS team_id FROM target_matches
+  UNION
+  SELECT loser_team_id AS team_id FROM target_matches
+),
+
+-- Step 3: Pre-compute team stats for ALL involved teams in one scan.
+team_stats AS (
+  SELECT
+    team_id,
+    COUNT(*) AS matches_played,
+    COUNT(*) FILTER (WHERE is_winner) AS wins,
+    COUNT(*) FILTER (WHERE NOT is_winner) AS losses
+  FROM (
+    SELECT winner_team_id AS team_id, true AS is_winner
+    FROM matches
+    WHERE winner_team_id IN (SELECT team_id FROM involved_team_ids)
+    UNION ALL
+    SELECT loser_team_id AS team_id, false AS is_winner
+    FROM matches
+    WHERE loser_team_id IN (SELECT team_id FROM involved_team_ids)
+  ) all_team_matches
+  GROUP BY team_id
+)
+
+-- Step 4: Build the JSON array by joining the pre-computed data.
+SELECT COALESCE(json_agg(json_build_object(
+  'match_id', m.match_id,
+  'played_at', m.played_at,
+  'is_fanny', m.is_fanny,
+  'notes', m.notes,
+  'winner_team_id', m.winner_team_id,
+  'loser_team_id', m.loser_team_id,
+  'elo_changes', json_build_object(
+    p_player_id::TEXT, json_build_object(
+      'old_elo', m.old_elo,
+      'new_elo', m.new_elo,
+      'difference', m.difference
+    )
+  ),
+  'winner_team', CASE WHEN wt.team_id IS NOT NULL THEN json_build_object(
+    'team_id', wt.team_id,
+    'global_elo', wt.global_elo,
+    'created_at', wt.created_at,
+    'last_match_at', wt.last_match_at,
+    'matches_played', COALESCE(wts.matches_played, 0),
+    'wins', COALESCE(wts.wins, 0),
+    'losses', COALESCE(wts.losses, 0),
+    'win_rate', CASE WHEN COALESCE(wts.matches_played, 0) > 0
+                     THEN (wts.wins::NUMERIC / wts.matches_played::NUMERIC) * 100
+                     ELSE 0 END,
+    'player1_id', wt.player1_id,
+    'player2_id', wt.player2_id,
+    'player1', CASE WHEN wtp1.player_id IS NOT NULL THEN json_build_object(
+      'player_id', wtp1.player_id,
+      'name', wtp1.name,
+      'global_elo', wtp1.global_elo,
+      'created_at', wtp1.created_at
+    ) ELSE NULL END,
+    'player2', CASE WHEN wtp2.player_id IS NOT NULL THEN json_build_object(
+      'player_id', wtp2.player_id,
+      'name', wtp2.name,
+      'global_elo', wtp2.global_elo,
+      'created_at', wtp2.created_at
+    ) ELSE NULL END
+  ) ELSE NULL END,
+  'loser_team', CASE WHEN lt.team_id IS NOT NULL THEN json_build_object(
+    'team_id', lt.team_id,
+    'global_elo', lt.global_elo,
+    'created_at', lt.created_at,
+    'last_match_at', lt.last_match_at,
+    'matches_played', COALESCE(lts.matches_played, 0),
+    'wins', COALESCE(lts.wins, 0),
+    'losses', COALESCE(lts.losses, 0),
+    'win_rate', CASE WHEN COALESCE(lts.matches_played, 0) > 0
+                     THEN (lts.wins::NUMERIC / lts.matches_played::NUMERIC) * 100
+                     ELSE 0 END,
+    'player1_id', lt.player1_id,
+    'player2_id', lt.player2_id,
+    'player1', CASE WHEN ltp1.player_id IS NOT NULL THEN json_build_object(
+      'player_id', ltp1.player_id,
+      'name', ltp1.name,
+      'global_elo', ltp1.global_elo,
+      'created_at', ltp1.created_at
+    ) ELSE NULL END,
+    'player2', CASE WHEN ltp2.player_id IS NOT NULL THEN json_build_object(
+      'player_id', ltp2.player_id,
+      'name', ltp2.name,
+      'global_elo', ltp2.global_elo,
+      'created_at', ltp2.created_at
+    ) ELSE NULL END
+  ) ELSE NULL END
+) ORDER BY m.played_at DESC), '[]'::json)
+FROM target_matches m
+LEFT JOIN teams wt ON m.winner_team_id = wt.team_id
+LEFT JOIN team_stats wts ON wts.team_id = wt.team_id
+LEFT JOIN players wtp1 ON wt.player1_id = wtp1.player_id
+LEFT JOIN players wtp2 ON wt.player2_id = wtp2.player_id
+LEFT JOIN teams lt ON m.loser_team_id = lt.team_id
+LEFT JOIN team_stats lts ON lts.team_id = lt.team_id
+LEFT JOIN players ltp1 ON lt.player1_id = ltp1.player_id
+LEFT JOIN players ltp2 ON lt.player2_id = ltp2.player_id;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_player_matches_json(BIGINT, TIMESTAMP, TIMESTAMP, BOOLEAN, INTEGER, INTEGER) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
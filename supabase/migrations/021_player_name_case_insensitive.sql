@@ -0,0 +1,25 @@
+-- ============================================
+-- Baby Foot ELO - Case-insensitive player name lookup
+-- Treats names differing only in case as the same player name
+-- ============================================
+
+-- [>]: Duplicate detection compared names exactly, so "Alice" and "alice"
+-- could both be registered. The lookup now matches on lower(name) alone,
+-- which is still a single seek on idx_players_name_lower.
+-- [!]: Rows that already collide case-insensitively would make the lookup
+-- return several players; the oldest one is returned.
+CREATE OR REPLACE FUNCTION public.get_player_by_name(p_name VARCHAR)
+RETURNS SETOF public.players
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT *
+  FROM players
+  WHERE lower(name) = lower(p_name)
+  ORDER BY player_id
+  LIMIT 1;
+$function$;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
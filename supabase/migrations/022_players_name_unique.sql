@@ -0,0 +1,21 @@
+-- ============================================
+-- Baby Foot ELO - Unique case-insensitive player names
+-- Enforces name uniqueness in the database instead of a pre-insert lookup
+-- ============================================
+
+-- [>]: Name uniqueness was only checked by a lookup before insert/update,
+-- which costs a round trip and leaves a race between check and write. A
+-- unique index on lower(name) makes the write itself fail with 23505, which
+-- the repository maps to PlayerAlreadyExistsError.
+-- [!]: Fails if existing rows already collide case-insensitively; rename
+-- those players before applying.
+-- text_pattern_ops keeps prefix searches (lower(name) LIKE 'pre%') and the
+-- get_player_by_name equality seek working, so it replaces the old index.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_players_name_lower_unique
+    ON public.players USING btree (lower(name) text_pattern_ops);
+
+DROP INDEX IF EXISTS public.idx_players_name_lower;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -0,0 +1,39 @@
+-- ============================================
+-- Baby Foot ELO - Single-player stats from the match stats view
+-- Reads precomputed aggregates instead of scanning matches per request
+-- ============================================
+
+-- [>]: get_player_full_stats_optimized counted the player's wins and losses
+-- by joining every match to its teams on each call. mv_player_match_stats
+-- (003) already holds those aggregates and is refreshed by
+-- refresh_match_stats() after each match write, so the lookup becomes a
+-- single indexed join. Output shape is unchanged.
+-- [!]: Stats are as fresh as the last refresh_match_stats() call.
+CREATE OR REPLACE FUNCTION public.get_player_full_stats_optimized(p_player_id INTEGER)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT jsonb_build_object(
+    'player_id', p.player_id,
+    'name', p.name,
+    'global_elo', p.global_elo,
+    'created_at', p.created_at,
+    'matches_played', COALESCE(ps.matches_played, 0),
+    'wins', COALESCE(ps.wins, 0),
+    'losses', COALESCE(ps.losses, 0),
+    'win_rate', CASE WHEN COALESCE(ps.matches_played, 0) > 0
+                     THEN ROUND(ps.wins::NUMERIC / ps.matches_played::NUMERIC, 4)
+                     ELSE 0 END,
+    'last_match_at', ps.last_match_at
+  )
+  FROM public.players p
+  LEFT JOIN public.mv_player_match_stats ps ON ps.player_id = p.player_id
+  WHERE p.player_id = p_player_id;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_player_full_stats_optimized(INTEGER) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
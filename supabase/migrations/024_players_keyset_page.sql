@@ -0,0 +1,43 @@
+-- ============================================
+-- Baby Foot ELO - Keyset pagination for the player list
+-- Pages players by player_id in SQL instead of slicing the full list
+-- ============================================
+
+-- [>]: GET /api/v1/players fetched every player with stats and sliced the
+-- page in memory, so each request cost O(players) regardless of limit.
+-- This returns one page ordered by player_id, starting after the cursor,
+-- so each request reads at most p_limit rows through the primary key.
+-- Rankings keep using get_all_players_with_stats_optimized (ELO order, rank).
+CREATE OR REPLACE FUNCTION public.get_players_with_stats_page(
+    p_limit INTEGER DEFAULT 50,
+    p_after_player_id INTEGER DEFAULT NULL
+)
+RETURNS SETOF jsonb
+LANGUAGE sql
+STABLE
+AS $function$
+  SELECT jsonb_build_object(
+    'player_id', p.player_id,
+    'name', p.name,
+    'global_elo', p.global_elo,
+    'created_at', p.created_at,
+    'matches_played', COALESCE(ps.matches_played, 0),
+    'wins', COALESCE(ps.wins, 0),
+    'losses', COALESCE(ps.losses, 0),
+    'win_rate', CASE WHEN COALESCE(ps.matches_played, 0) > 0
+                     THEN ROUND(ps.wins::NUMERIC / ps.matches_played::NUMERIC, 4)
+                     ELSE 0 END,
+    'last_match_at', ps.last_match_at
+  )
+  FROM public.players p
+  LEFT JOIN public.mv_player_match_stats ps ON ps.player_id = p.player_id
+  WHERE p_after_player_id IS NULL OR p.player_id > p_after_player_id
+  ORDER BY p.player_id
+  LIMIT p_limit;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.get_players_with_stats_page(INTEGER, INTEGER) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
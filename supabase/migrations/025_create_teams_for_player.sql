@@ -0,0 +1,36 @@
+-- ============================================
+-- Baby Foot ELO - Generate a new player's teams in SQL
+-- Builds the partner pair list inside the insert instead of in the API
+-- ============================================
+
+-- [>]: createNewPlayer read every player with stats, built one
+-- (player1_id, player2_id) row per partner in TypeScript and sent them all
+-- back in an upsert. The pairs are derivable from players alone, so a single
+-- INSERT ... SELECT now builds them in canonical order (LEAST/GREATEST) and
+-- skips pairs that already exist. Returns the number of teams created.
+CREATE OR REPLACE FUNCTION public.create_teams_for_player(
+    p_player_id INTEGER,
+    p_global_elo INTEGER DEFAULT 1000
+)
+RETURNS INTEGER
+LANGUAGE sql
+AS $function$
+  WITH created AS (
+    INSERT INTO public.teams (player1_id, player2_id, global_elo)
+    SELECT
+      LEAST(p.player_id, p_player_id),
+      GREATEST(p.player_id, p_player_id),
+      p_global_elo
+    FROM public.players p
+    WHERE p.player_id <> p_player_id
+    ON CONFLICT (player1_id, player2_id) DO NOTHING
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM created;
+$function$;
+
+GRANT EXECUTE ON FUNCTION public.create_teams_for_player(INTEGER, INTEGER) TO anon, authenticated, service_role;
+
+-- ============================================
+-- Migration complete!
+-- ============================================
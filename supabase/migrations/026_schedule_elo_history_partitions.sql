@@ -0,0 +1,37 @@
+-- ============================================
+-- Baby Foot ELO - Schedule ELO history partition creation
+-- Creates the yearly history partitions ahead of time with pg_cron
+-- ============================================
+
+-- [>]: Migration 002 only created partitions through the year after it ran.
+-- Later rows fell into the default partitions, which every date-bounded scan
+-- has to read, until someone ran ensure_elo_history_partitions by hand. A
+-- monthly job now creates the current and next year's partitions. The
+-- function skips partitions that already exist, so re-runs are no-ops, and
+-- any rows already in the default partition move into the new one.
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+-- [>]: Cover the years between migration 002 and this one.
+SELECT public.ensure_elo_history_partitions(y::INTEGER)
+FROM generate_series(
+    EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC'),
+    EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC') + 1
+) AS y;
+
+-- [!]: cron.schedule replaces an existing job of the same name, so the
+-- migration can be re-applied safely.
+SELECT cron.schedule(
+    'ensure-elo-history-partitions',
+    '0 3 1 * *',
+    $cron$
+    SELECT public.ensure_elo_history_partitions(y::INTEGER)
+    FROM generate_series(
+        EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC'),
+        EXTRACT(YEAR FROM now() AT TIME ZONE 'UTC') + 1
+    ) AS y;
+    $cron$
+);
+
+-- ============================================
+-- Migration complete!
+-- ============================================
@@ -145,6 +145,35 @@ describe.skipIf(!hasSupabaseConfig)("API Route Handlers", () => {
       expect(Array.isArray(data)).toBe(true);
     });
 
+    it("GET /players pages by player_id after a cursor", async () => {
+      const response = await playersGet(
+        createRequest("/api/v1/players?after=0&limit=1"),
+      );
+      const data = await response.json();
+
+      expect(response.status).toBe(200);
+      expect(data).toHaveLength(1);
+
+      const cursor = data[0].player_id;
+      const next = await playersGet(
+        createRequest(`/api/v1/players?after=${cursor}&limit=50`),
+      );
+      const nextData: Array<{ player_id: number }> = await next.json();
+
+      expect(next.status).toBe(200);
+      expect(nextData.every((p) => p.player_id > cursor)).toBe(true);
+    });
+
+    it("GET /players returns 422 for invalid cursor", async () => {
+      const response = await playersGet(
+        createRequest("/api/v1/players?after=abc"),
+      );
+      const data = await response.json();
+
+      expect(response.status).toBe(422);
+      expect(data.detail).toBeDefined();
+    });
+
     it("GET /players/[id] returns player details", async () => {
       if (!testPlayerId) return;
 
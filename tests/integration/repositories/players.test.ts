@@ -5,13 +5,17 @@
 import { describe, it, expect, beforeAll, afterAll } from "vitest";
 import {
   createPlayerByName,
+  createPlayer,
   getPlayerById,
   getPlayerByName,
   getAllPlayers,
   updatePlayer,
   deletePlayerById,
 } from "@/lib/db/repositories/players";
-import { PlayerNotFoundError } from "@/lib/errors/api-errors";
+import {
+  PlayerAlreadyExistsError,
+  PlayerNotFoundError,
+} from "@/lib/errors/api-errors";
 
 // [>]: Check if Supabase env vars are configured.
 const hasSupabaseConfig =
@@ -47,6 +51,12 @@ describe.skipIf(!hasSupabaseConfig)("Player Repository", () => {
       // [>]: Clean up.
       await deletePlayerById(playerId);
     });
+
+    it("throws PlayerAlreadyExistsError for a duplicate name", async () => {
+      await expect(
+        createPlayer(testPlayerName.toUpperCase(), 1000),
+      ).rejects.toThrow(PlayerAlreadyExistsError);
+    });
   });
 
   describe("getPlayerById", () => {
@@ -71,6 +81,13 @@ describe.skipIf(!hasSupabaseConfig)("Player Repository", () => {
       expect(player!.player_id).toBe(testPlayerId);
     });
 
+    it("matches names case-insensitively", async () => {
+      const player = await getPlayerByName(testPlayerName.toUpperCase());
+
+      expect(player).not.toBeNull();
+      expect(player!.player_id).toBe(testPlayerId);
+    });
+
     it("returns null when not found", async () => {
       const player = await getPlayerByName("NonExistent Player 999999");
 
@@ -113,6 +130,19 @@ describe.skipIf(!hasSupabaseConfig)("Player Repository", () => {
         PlayerNotFoundError,
       );
     });
+
+    it("throws PlayerAlreadyExistsError when the name is taken", async () => {
+      const otherName = `Duplicate Target ${Date.now()}`;
+      const otherId = await createPlayerByName(otherName);
+
+      try {
+        await expect(
+          updatePlayer(testPlayerId, { name: otherName }),
+        ).rejects.toThrow(PlayerAlreadyExistsError);
+      } finally {
+        await deletePlayerById(otherId);
+      }
+    });
   });
 
   describe("deletePlayerById", () => {
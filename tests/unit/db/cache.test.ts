@@ -0,0 +1,54 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import { TtlCache } from "@/lib/db/cache";
+
+describe("TtlCache", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("should return cached value before it expires", () => {
+    const cache = new TtlCache<number, string>({ ttlMs: 1000 });
+    cache.set(1, "alice");
+
+    vi.advanceTimersByTime(999);
+
+    expect(cache.get(1)).toBe("alice");
+  });
+
+  it("should drop value once ttl has elapsed", () => {
+    const cache = new TtlCache<number, string>({ ttlMs: 1000 });
+    cache.set(1, "alice");
+
+    vi.advanceTimersByTime(1000);
+
+    expect(cache.get(1)).toBeUndefined();
+  });
+
+  it("should evict oldest entry when full", () => {
+    const cache = new TtlCache<number, string>({ ttlMs: 1000, maxEntries: 2 });
+    cache.set(1, "alice");
+    cache.set(2, "bob");
+    cache.set(3, "carol");
+
+    expect(cache.get(1)).toBeUndefined();
+    expect(cache.get(2)).toBe("bob");
+    expect(cache.get(3)).toBe("carol");
+  });
+
+  it("should remove entries on delete and clear", () => {
+    const cache = new TtlCache<number, string>({ ttlMs: 1000 });
+    cache.set(1, "alice");
+    cache.set(2, "bob");
+
+    cache.delete(1);
+    expect(cache.get(1)).toBeUndefined();
+    expect(cache.get(2)).toBe("bob");
+
+    cache.clear();
+    expect(cache.get(2)).toBeUndefined();
+  });
+});
@@ -1,5 +1,9 @@
 import { describe, expect, it, vi } from "vitest";
 import { withRetry } from "@/lib/db/retry";
+import {
+  PlayerAlreadyExistsError,
+  PlayerOperationError,
+} from "@/lib/errors/api-errors";
 
 describe("withRetry", () => {
   it("should return result on first successful call", async () => {
@@ -34,4 +38,23 @@ describe("withRetry", () => {
     await expect(wrapped()).rejects.toThrow("persistent failure");
     expect(fn).toHaveBeenCalledTimes(3);
   });
+
+  it("should not retry client errors", async () => {
+    const fn = vi.fn().mockRejectedValue(new PlayerAlreadyExistsError("Alice"));
+    const wrapped = withRetry(fn, { retryDelay: 10 });
+
+    await expect(wrapped()).rejects.toThrow(PlayerAlreadyExistsError);
+    expect(fn).toHaveBeenCalledTimes(1);
+  });
+
+  it("should retry operation errors", async () => {
+    const fn = vi
+      .fn()
+      .mockRejectedValueOnce(new PlayerOperationError("connection reset"))
+      .mockResolvedValue("success");
+    const wrapped = withRetry(fn, { retryDelay: 10 });
+
+    await expect(wrapped()).resolves.toBe("success");
+    expect(fn).toHaveBeenCalledTimes(2);
+  });
 });
@@ -3,9 +3,13 @@ import {
   calculateTeamElo,
   calculateWinProbability,
   determineKFactor,
+  determineKFactorsBatch,
   calculateEloChange,
   calculateEloChangesWithPoolCorrection,
+  calculateEloChangesBatch,
   calculatePlayersEloChange,
+  calculatePlayersEloChangesBatch,
+  calculateTeamEloChangesBatch,
   processMatchResult,
   K_TIER1,
   K_TIER2,
@@ -13,6 +17,7 @@ import {
   type TeamWithPlayers,
 } from "@/lib/services/elo";
 import { ValidationError } from "@/lib/errors/api-errors";
+import { MAX_ELO } from "@/lib/types/schemas/player";
 
 // [>]: Helper to create team objects for testing.
 function createTeam(
@@ -70,6 +75,18 @@ describe("calculateWinProbability", () => {
     expect(probA + probB).toBeCloseTo(1, 10);
   });
 
+  it("should match the formula outside the precomputed delta range", () => {
+    // [>]: Deltas beyond +/-4000 and fractional ELOs skip the lookup table.
+    expect(calculateWinProbability(5000, 0)).toBeCloseTo(
+      1 / (1 + 10 ** (-5000 / 400)),
+      10,
+    );
+    expect(calculateWinProbability(1500.5, 1500)).toBeCloseTo(
+      1 / (1 + 10 ** (-0.5 / 400)),
+      10,
+    );
+  });
+
   it("should throw ValidationError for negative ELO", () => {
     expect(() => calculateWinProbability(-1500, 1500)).toThrow(ValidationError);
   });
@@ -99,6 +116,24 @@ describe("determineKFactor", () => {
   });
 });
 
+describe("determineKFactorsBatch", () => {
+  it("should match determineKFactor for every rating", () => {
+    const elos = [0, 1199, 1200, 1799, 1800, 5000];
+    const kFactors = determineKFactorsBatch(elos);
+
+    expect(Array.from(kFactors)).toEqual(elos.map(determineKFactor));
+  });
+
+  it("should return K factors in an array wide enough for any tier", () => {
+    // [>]: A byte array would silently wrap K factors above 255.
+    expect(determineKFactorsBatch([1000])).toBeInstanceOf(Int32Array);
+  });
+
+  it("should throw ValidationError for negative ELO", () => {
+    expect(() => determineKFactorsBatch([1500, -1])).toThrow(ValidationError);
+  });
+});
+
 describe("calculateEloChange", () => {
   it("should return positive change for win with 0.5 probability", () => {
     // K=100 (ELO 1500), win with 0.5 prob: 100 * (1 - 0.5) = 50
@@ -171,6 +206,89 @@ describe("calculateEloChangesWithPoolCorrection", () => {
     // [>]: Due to integer truncation, may be off by 1-2.
     expect(Math.abs(totalChange)).toBeLessThanOrEqual(2);
   });
+
+  it("should throw ValidationError for invalid competitor data", () => {
+    const valid = {
+      old_elo: 1500,
+      win_prob: 0.5,
+      match_result: 1 as const,
+      k_factor: 100,
+    };
+
+    expect(() =>
+      calculateEloChangesWithPoolCorrection({ 1: { ...valid, old_elo: -1 } }),
+    ).toThrow(ValidationError);
+    expect(() =>
+      calculateEloChangesWithPoolCorrection({ 1: { ...valid, win_prob: 1.5 } }),
+    ).toThrow(ValidationError);
+    expect(() =>
+      calculateEloChangesWithPoolCorrection({ 1: { ...valid, k_factor: -50 } }),
+    ).toThrow(ValidationError);
+  });
+});
+
+describe("calculateEloChangesBatch", () => {
+  it("should apply pool correction independently per group", () => {
+    const changes = calculateEloChangesBatch(
+      [1500, 1500, 1000, 2000],
+      [0.5, 0.5, 0.1, 0.9],
+      [1, 0, 1, 0],
+      [100, 100, 200, 50],
+      2,
+    );
+
+    expect(changes[0] + changes[1]).toBe(0);
+    expect(Math.abs(changes[2] + changes[3])).toBeLessThanOrEqual(2);
+  });
+
+  it("should match calculateEloChangesWithPoolCorrection for one group", () => {
+    const changes = calculateEloChangesBatch(
+      [1000, 2000],
+      [0.1, 0.9],
+      [1, 0],
+      [200, 50],
+      2,
+    );
+    const result = calculateEloChangesWithPoolCorrection({
+      1: { old_elo: 1000, win_prob: 0.1, match_result: 1, k_factor: 200 },
+      2: { old_elo: 2000, win_prob: 0.9, match_result: 0, k_factor: 50 },
+    });
+
+    expect(changes[0]).toBe(result[1].difference);
+    expect(changes[1]).toBe(result[2].difference);
+  });
+
+  it("should throw ValidationError for mismatched lengths", () => {
+    expect(() =>
+      calculateEloChangesBatch([1500, 1500], [0.5], [1, 0], [100, 100], 2),
+    ).toThrow(ValidationError);
+    expect(() =>
+      calculateEloChangesBatch([1500], [0.5], [1], [100], 2),
+    ).toThrow(ValidationError);
+  });
+
+  it("should throw ValidationError for invalid inputs", () => {
+    const batch = (
+      oldElo: number,
+      winProb: number,
+      matchResult: number,
+      kFactor: number,
+    ) => () =>
+      calculateEloChangesBatch(
+        [oldElo, 1500],
+        [winProb, 0.5],
+        [matchResult, 0],
+        [kFactor, 100],
+        2,
+      );
+
+    expect(batch(-1, 0.5, 1, 100)).toThrow("ELO rating must be non-negative");
+    expect(batch(1500, -0.1, 1, 100)).toThrow(ValidationError);
+    expect(batch(1500, Number.NaN, 1, 100)).toThrow(ValidationError);
+    expect(batch(1500, 0.5, 2, 100)).toThrow("Match result must be 0 or 1");
+    expect(batch(1500, 0.5, 1, -100)).toThrow(ValidationError);
+    expect(batch(1500, 0.5, 1, 1000)).toThrow(ValidationError);
+  });
 });
 
 describe("calculatePlayersEloChange", () => {
@@ -215,6 +333,69 @@ describe("calculatePlayersEloChange", () => {
   });
 });
 
+describe("calculatePlayersEloChangesBatch", () => {
+  it("should match calculatePlayersEloChange for each match", () => {
+    const matches = [
+      [createTeam(1, 0, 1, 1600, 2, 1400), createTeam(2, 0, 3, 1200, 4, 1100)],
+      [createTeam(3, 0, 5, 1000, 6, 1000), createTeam(4, 0, 7, 1900, 8, 2100)],
+    ];
+    const changes = calculatePlayersEloChangesBatch([
+      1600, 1400, 1200, 1100, 1000, 1000, 1900, 2100,
+    ]);
+
+    matches.forEach(([winningTeam, losingTeam], match) => {
+      const result = calculatePlayersEloChange(winningTeam, losingTeam);
+      const ids = [
+        winningTeam.player1.player_id,
+        winningTeam.player2.player_id,
+        losingTeam.player1.player_id,
+        losingTeam.player2.player_id,
+      ];
+      ids.forEach((id, slot) => {
+        expect(changes[match * 4 + slot]).toBe(result[id].difference);
+      });
+    });
+  });
+
+  it("should throw ValidationError for incomplete matches", () => {
+    expect(() => calculatePlayersEloChangesBatch([1500, 1500, 1500])).toThrow(
+      ValidationError,
+    );
+  });
+});
+
+describe("calculateTeamEloChangesBatch", () => {
+  it("should match processMatchResult team changes for each match", () => {
+    const matches = [
+      [createTeam(1, 1500, 1, 0, 2, 0), createTeam(2, 1150, 3, 0, 4, 0)],
+      [createTeam(3, 1000, 5, 0, 6, 0), createTeam(4, 2000, 7, 0, 8, 0)],
+    ];
+    const changes = calculateTeamEloChangesBatch([1500, 1150, 1000, 2000]);
+
+    matches.forEach(([winningTeam, losingTeam], match) => {
+      const [, teamChanges] = processMatchResult(winningTeam, losingTeam);
+      expect(changes[match * 2]).toBe(
+        teamChanges[winningTeam.team_id].difference,
+      );
+      expect(changes[match * 2 + 1]).toBe(
+        teamChanges[losingTeam.team_id].difference,
+      );
+    });
+  });
+
+  it("should keep team ratings within [0, MAX_ELO]", () => {
+    const changes = calculateTeamEloChangesBatch([30, 60, 32760, MAX_ELO]);
+
+    // [>]: Unclamped, the first loser would drop to about -32 and the second
+    // winner would gain 25.
+    expect(Array.from(changes)).toEqual([108, -60, 7, -25]);
+  });
+
+  it("should throw ValidationError for an odd length", () => {
+    expect(() => calculateTeamEloChangesBatch([1500])).toThrow(ValidationError);
+  });
+});
+
 describe("processMatchResult", () => {
   it("should return both player and team ELO changes", () => {
     const winningTeam = createTeam(1, 1500, 1, 1500, 2, 1500);
@@ -277,4 +458,73 @@ describe("processMatchResult", () => {
     expect(playerChanges[3].difference).toBeGreaterThanOrEqual(-5);
     expect(playerChanges[4].difference).toBeGreaterThanOrEqual(-5);
   });
+
+  it("should truncate pool-corrected player changes once", () => {
+    const winningTeam = createTeam(1, 1200, 1, 1100, 2, 1300);
+    const losingTeam = createTeam(2, 1725, 3, 1600, 4, 1850);
+
+    const [playerChanges] = processMatchResult(winningTeam, losingTeam);
+
+    // [>]: trunc(initial + K * correction). Truncating the initial change and
+    // the correction separately gave 127, 64, -126, -62 (sum +3).
+    expect(playerChanges[1].difference).toBe(127);
+    expect(playerChanges[2].difference).toBe(63);
+    expect(playerChanges[3].difference).toBe(-127);
+    expect(playerChanges[4].difference).toBe(-63);
+    expect(playerChanges[1].new_elo).toBe(1227);
+    expect(playerChanges[4].new_elo).toBe(1787);
+
+    const total =
+      playerChanges[1].difference +
+      playerChanges[2].difference +
+      playerChanges[3].difference +
+      playerChanges[4].difference;
+    expect(total).toBe(0);
+  });
+
+  it("should not take a player rating below 0", () => {
+    const winningTeam = createTeam(1, 1000, 1, 1000, 2, 1000);
+    const losingTeam = createTeam(2, 1005, 3, 10, 4, 2000);
+
+    const [playerChanges] = processMatchResult(winningTeam, losingTeam);
+
+    // [>]: The pool change for player 3 is about -133; it stops at 0.
+    expect(playerChanges[3]).toEqual({
+      old_elo: 10,
+      new_elo: 0,
+      difference: -10,
+    });
+    expect(playerChanges[4].difference).toBe(-31);
+  });
+
+  it("should not take a player rating above MAX_ELO", () => {
+    const winningTeam = createTeam(1, 1000, 1, 32760, 2, 0);
+    const losingTeam = createTeam(2, 1000, 3, 32767, 4, 32767);
+
+    const [playerChanges] = processMatchResult(winningTeam, losingTeam);
+
+    expect(playerChanges[1]).toEqual({
+      old_elo: 32760,
+      new_elo: MAX_ELO,
+      difference: 7,
+    });
+    expect(playerChanges[2].new_elo).toBe(114);
+  });
+
+  it("should truncate pool-corrected team changes once", () => {
+    const winningTeam = createTeam(1, 1000, 1, 1000, 2, 1000);
+    const losingTeam = createTeam(2, 1300, 3, 1300, 4, 1300);
+
+    const [, teamChanges] = processMatchResult(winningTeam, losingTeam);
+
+    // [>]: Truncating the initial change and the correction separately gave
+    // 113 and -112 (sum +1).
+    expect(teamChanges[1].difference).toBe(113);
+    expect(teamChanges[2].difference).toBe(-113);
+    expect(teamChanges[1].new_elo).toBe(1113);
+    expect(teamChanges[2].new_elo).toBe(1187);
+    expect(teamChanges[1].difference).toBeGreaterThan(0);
+    expect(teamChanges[2].difference).toBeLessThan(0);
+    expect(teamChanges[1].difference + teamChanges[2].difference).toBe(0);
+  });
 });
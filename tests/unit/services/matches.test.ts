@@ -0,0 +1,119 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+// [>]: Mock repositories and sibling services so only match logic runs.
+vi.mock("@/lib/db/repositories/matches", () => ({
+  recordMatchWithElo: vi.fn(),
+  getMatchById: vi.fn(),
+  getMatchWithEloById: vi.fn(),
+  getAllMatches: vi.fn(),
+  getMatchesByTeamId: vi.fn(),
+  getMatchesByPlayerId: vi.fn(),
+  deleteMatchById: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/stats", () => ({
+  refreshMatchStats: vi.fn(),
+}));
+vi.mock("@/lib/services/players", () => ({
+  invalidatePlayerCache: vi.fn(),
+}));
+vi.mock("@/lib/services/teams", () => ({
+  getTeamsByIds: vi.fn(),
+}));
+
+import {
+  deleteMatchById,
+  recordMatchWithElo,
+} from "@/lib/db/repositories/matches";
+import { refreshMatchStats } from "@/lib/db/repositories/stats";
+import { invalidatePlayerCache } from "@/lib/services/players";
+import { getTeamsByIds } from "@/lib/services/teams";
+import { createNewMatch, deleteMatch } from "@/lib/services/matches";
+import type { PlayerResponse } from "@/lib/types/schemas/player";
+import type { TeamResponse } from "@/lib/types/schemas/team";
+
+// [>]: Build a team as returned by getTeamsByIds, with partial player data.
+function teamResponse(
+  teamId: number,
+  player1Id: number,
+  player2Id: number,
+): TeamResponse {
+  const player = (playerId: number) =>
+    ({ player_id: playerId, global_elo: 1000 }) as PlayerResponse;
+  return {
+    team_id: teamId,
+    player1_id: player1Id,
+    player2_id: player2Id,
+    global_elo: 1000,
+    created_at: "2024-01-01T00:00:00Z",
+    last_match_at: null,
+    matches_played: 0,
+    wins: 0,
+    losses: 0,
+    win_rate: 0,
+    player1: player(player1Id),
+    player2: player(player2Id),
+  };
+}
+
+const matchData = {
+  winner_team_id: 1,
+  loser_team_id: 2,
+  is_fanny: false,
+  played_at: "2024-06-01T12:00:00Z",
+};
+
+// [>]: Assert the cache was invalidated after the stats refresh ran.
+function expectInvalidatedAfterRefresh(): void {
+  expect(
+    vi.mocked(invalidatePlayerCache).mock.invocationCallOrder[0],
+  ).toBeGreaterThan(vi.mocked(refreshMatchStats).mock.invocationCallOrder[0]);
+}
+
+beforeEach(() => {
+  vi.resetAllMocks();
+});
+
+describe("createNewMatch", () => {
+  beforeEach(() => {
+    vi.mocked(getTeamsByIds).mockResolvedValue([
+      teamResponse(1, 1, 2),
+      teamResponse(2, 3, 4),
+    ]);
+    vi.mocked(recordMatchWithElo).mockResolvedValue(10);
+  });
+
+  it("should invalidate the four players after the stats refresh", async () => {
+    await createNewMatch(matchData);
+
+    expect(invalidatePlayerCache).toHaveBeenCalledTimes(1);
+    expect(invalidatePlayerCache).toHaveBeenCalledWith([1, 2, 3, 4]);
+    expectInvalidatedAfterRefresh();
+  });
+
+  it("should still invalidate when the stats refresh fails", async () => {
+    vi.mocked(refreshMatchStats).mockRejectedValue(new Error("refresh"));
+    const warn = vi.spyOn(console, "warn").mockImplementation(() => {});
+
+    await createNewMatch(matchData);
+
+    expect(invalidatePlayerCache).toHaveBeenCalledTimes(1);
+    warn.mockRestore();
+  });
+
+  it("should not invalidate when recording fails", async () => {
+    vi.mocked(recordMatchWithElo).mockRejectedValue(new Error("rpc failed"));
+
+    await expect(createNewMatch(matchData)).rejects.toThrow();
+    expect(invalidatePlayerCache).not.toHaveBeenCalled();
+  });
+});
+
+describe("deleteMatch", () => {
+  it("should clear the whole cache after the stats refresh", async () => {
+    await deleteMatch(10);
+
+    expect(deleteMatchById).toHaveBeenCalledWith(10);
+    expect(invalidatePlayerCache).toHaveBeenCalledWith();
+    expectInvalidatedAfterRefresh();
+  });
+});
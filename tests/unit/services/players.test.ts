@@ -0,0 +1,138 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+// [>]: Mock the repositories so the service logic runs without a database.
+vi.mock("@/lib/db/repositories/players", () => ({
+  createPlayer: vi.fn(),
+  getAllPlayers: vi.fn(),
+  getPlayersPage: vi.fn(),
+  getPlayerById: vi.fn(),
+  updatePlayer: vi.fn(),
+  deletePlayerById: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/stats", () => ({
+  getPlayerStats: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/teams", () => ({
+  createTeamsForPlayer: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/player-elo-history", () => ({
+  getPlayerEloHistory: vi.fn(),
+}));
+
+import { createPlayer, getAllPlayers } from "@/lib/db/repositories/players";
+import { getPlayerStats } from "@/lib/db/repositories/stats";
+import { createTeamsForPlayer } from "@/lib/db/repositories/teams";
+import {
+  createNewPlayer,
+  getAllPlayersWithStats,
+  getPlayer,
+  invalidatePlayerCache,
+} from "@/lib/services/players";
+import {
+  InvalidPlayerDataError,
+  PlayerAlreadyExistsError,
+  PlayerOperationError,
+} from "@/lib/errors/api-errors";
+
+const playerRow = {
+  player_id: 5,
+  name: "Alice",
+  global_elo: 1000,
+  created_at: "2024-01-01T00:00:00Z",
+};
+
+beforeEach(() => {
+  vi.resetAllMocks();
+  invalidatePlayerCache();
+});
+
+describe("createNewPlayer", () => {
+  it("should create the player's teams in one repository call", async () => {
+    vi.mocked(createPlayer).mockResolvedValue(playerRow);
+    vi.mocked(createTeamsForPlayer).mockResolvedValue(3);
+
+    const player = await createNewPlayer({
+      name: "  Alice ",
+      global_elo: 1000,
+    });
+
+    expect(createPlayer).toHaveBeenCalledWith("Alice", 1000);
+    expect(createTeamsForPlayer).toHaveBeenCalledTimes(1);
+    expect(createTeamsForPlayer).toHaveBeenCalledWith(5);
+    expect(getAllPlayers).not.toHaveBeenCalled();
+    expect(player).toEqual({
+      ...playerRow,
+      last_match_at: null,
+      matches_played: 0,
+      wins: 0,
+      losses: 0,
+      win_rate: 0,
+    });
+  });
+
+  it("should reject a blank name before any database call", async () => {
+    await expect(
+      createNewPlayer({ name: "   ", global_elo: 1000 }),
+    ).rejects.toThrow(InvalidPlayerDataError);
+    expect(createPlayer).not.toHaveBeenCalled();
+  });
+
+  it("should pass PlayerAlreadyExistsError through unwrapped", async () => {
+    vi.mocked(createPlayer).mockRejectedValue(
+      new PlayerAlreadyExistsError("Alice"),
+    );
+
+    await expect(
+      createNewPlayer({ name: "Alice", global_elo: 1000 }),
+    ).rejects.toThrow(PlayerAlreadyExistsError);
+    expect(createTeamsForPlayer).not.toHaveBeenCalled();
+  });
+
+  it("should wrap a team creation failure", async () => {
+    vi.mocked(createPlayer).mockResolvedValue(playerRow);
+    vi.mocked(createTeamsForPlayer).mockRejectedValue(new Error("rpc failed"));
+
+    await expect(
+      createNewPlayer({ name: "Alice", global_elo: 1000 }),
+    ).rejects.toThrow(PlayerOperationError);
+  });
+});
+
+describe("invalidatePlayerCache", () => {
+  const statsRow = {
+    ...playerRow,
+    last_match_at: null,
+    matches_played: 0,
+    wins: 0,
+    losses: 0,
+    win_rate: 0,
+  };
+
+  it("should serve a cached player until it is invalidated", async () => {
+    vi.mocked(getPlayerStats).mockResolvedValue(statsRow);
+
+    await getPlayer(5);
+    await getPlayer(5);
+    expect(getPlayerStats).toHaveBeenCalledTimes(1);
+
+    invalidatePlayerCache([5]);
+    vi.mocked(getPlayerStats).mockResolvedValue({
+      ...statsRow,
+      global_elo: 1020,
+    });
+
+    const player = await getPlayer(5);
+    expect(getPlayerStats).toHaveBeenCalledTimes(2);
+    expect(player.global_elo).toBe(1020);
+  });
+
+  it("should clear the player list on any invalidation", async () => {
+    vi.mocked(getAllPlayers).mockResolvedValue([statsRow]);
+
+    await getAllPlayersWithStats();
+    invalidatePlayerCache([99]);
+    await getAllPlayersWithStats();
+
+    expect(getAllPlayers).toHaveBeenCalledTimes(2);
+  });
+});
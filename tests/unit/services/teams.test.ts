@@ -0,0 +1,203 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+// [>]: Mock the repositories so the service logic runs without a database.
+vi.mock("@/lib/db/repositories/teams", () => ({
+  createTeamByPlayerIds: vi.fn(),
+  getAllTeams: vi.fn(),
+  getActiveTeamsWithStats: vi.fn(),
+  getTeamsByPlayerId: vi.fn(),
+  updateTeam: vi.fn(),
+  deleteTeamById: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/players", () => ({
+  getPlayersByIds: vi.fn(),
+}));
+vi.mock("@/lib/db/repositories/stats", () => ({
+  getTeamStats: vi.fn(),
+  getTeamsStats: vi.fn(),
+}));
+
+import {
+  createTeamByPlayerIds,
+  getTeamsByPlayerId,
+  updateTeam,
+  deleteTeamById,
+} from "@/lib/db/repositories/teams";
+import { getPlayersByIds } from "@/lib/db/repositories/players";
+import { getTeamStats, getTeamsStats } from "@/lib/db/repositories/stats";
+import {
+  createNewTeam,
+  getTeamsByPlayer,
+  updateExistingTeam,
+  deleteTeam,
+} from "@/lib/services/teams";
+import {
+  InvalidTeamDataError,
+  PlayerNotFoundError,
+  TeamNotFoundError,
+} from "@/lib/errors/api-errors";
+
+// [>]: Build a team stats row as returned by the stats RPCs.
+function teamStatsRow(teamId: number, player1Id = 1, player2Id = 2) {
+  return {
+    team_id: teamId,
+    player1_id: player1Id,
+    player2_id: player2Id,
+    global_elo: 1000,
+    created_at: "2024-01-01T00:00:00Z",
+    last_match_at: null,
+    matches_played: 0,
+    wins: 0,
+    losses: 0,
+    win_rate: 0,
+  };
+}
+
+// [>]: Build a player row as returned by getPlayersByIds.
+function playerRow(playerId: number) {
+  return {
+    player_id: playerId,
+    name: `Player ${playerId}`,
+    global_elo: 1000,
+    created_at: "2024-01-01T00:00:00Z",
+  };
+}
+
+beforeEach(() => {
+  vi.resetAllMocks();
+});
+
+describe("getTeamsByPlayer", () => {
+  it("should load stats for all teams in one batch call", async () => {
+    vi.mocked(getTeamsByPlayerId).mockResolvedValue([
+      teamStatsRow(1, 1, 2),
+      teamStatsRow(2, 1, 3),
+    ]);
+    vi.mocked(getTeamsStats).mockResolvedValue([
+      teamStatsRow(1, 1, 2),
+      teamStatsRow(2, 1, 3),
+    ]);
+
+    const teams = await getTeamsByPlayer(1);
+
+    expect(getTeamsStats).toHaveBeenCalledTimes(1);
+    expect(getTeamsStats).toHaveBeenCalledWith([1, 2], { skipMissing: true });
+    expect(getTeamStats).not.toHaveBeenCalled();
+    expect(teams.map((team) => team.team_id)).toEqual([1, 2]);
+  });
+
+  it("should skip a team missing from the stats batch", async () => {
+    vi.mocked(getTeamsByPlayerId).mockResolvedValue([
+      teamStatsRow(1, 1, 2),
+      teamStatsRow(2, 1, 3),
+    ]);
+    vi.mocked(getTeamsStats).mockResolvedValue([teamStatsRow(2, 1, 3)]);
+
+    const teams = await getTeamsByPlayer(1);
+
+    expect(teams.map((team) => team.team_id)).toEqual([2]);
+  });
+
+  it("should return an empty list without a stats call", async () => {
+    vi.mocked(getTeamsByPlayerId).mockResolvedValue([]);
+
+    const teams = await getTeamsByPlayer(1);
+
+    expect(teams).toEqual([]);
+    expect(getTeamsStats).not.toHaveBeenCalled();
+  });
+});
+
+describe("createNewTeam", () => {
+  it("should check both players with a single lookup", async () => {
+    vi.mocked(getPlayersByIds).mockResolvedValue([playerRow(1), playerRow(2)]);
+    vi.mocked(createTeamByPlayerIds).mockResolvedValue(7);
+    vi.mocked(getTeamStats).mockResolvedValue(teamStatsRow(7));
+
+    const team = await createNewTeam({
+      player1_id: 1,
+      player2_id: 2,
+      global_elo: 1000,
+    });
+
+    expect(getPlayersByIds).toHaveBeenCalledTimes(1);
+    expect(getPlayersByIds).toHaveBeenCalledWith([1, 2]);
+    expect(createTeamByPlayerIds).toHaveBeenCalledWith(1, 2, 1000);
+    expect(team.team_id).toBe(7);
+  });
+
+  it("should reject a team with a missing player", async () => {
+    vi.mocked(getPlayersByIds).mockResolvedValue([playerRow(1)]);
+
+    const promise = createNewTeam({
+      player1_id: 1,
+      player2_id: 99,
+      global_elo: 1000,
+    });
+
+    await expect(promise).rejects.toThrow(InvalidTeamDataError);
+    await expect(promise).rejects.toThrow("Players not found: 99");
+    expect(createTeamByPlayerIds).not.toHaveBeenCalled();
+  });
+
+  it("should list every missing player", async () => {
+    vi.mocked(getPlayersByIds).mockResolvedValue([]);
+
+    await expect(
+      createNewTeam({ player1_id: 98, player2_id: 99, global_elo: 1000 }),
+    ).rejects.toThrow("Players not found: 98, 99");
+  });
+
+  it("should pass PlayerNotFoundError through unwrapped", async () => {
+    vi.mocked(getPlayersByIds).mockResolvedValue([playerRow(1), playerRow(2)]);
+    vi.mocked(createTeamByPlayerIds).mockRejectedValue(
+      new PlayerNotFoundError(2),
+    );
+
+    await expect(
+      createNewTeam({ player1_id: 1, player2_id: 2, global_elo: 1000 }),
+    ).rejects.toThrow(PlayerNotFoundError);
+  });
+});
+
+describe("updateExistingTeam", () => {
+  it("should update without a prior existence lookup", async () => {
+    vi.mocked(getTeamStats).mockResolvedValue(teamStatsRow(3));
+
+    const team = await updateExistingTeam(3, { global_elo: 1100 });
+
+    expect(updateTeam).toHaveBeenCalledWith(3, {
+      global_elo: 1100,
+      last_match_at: undefined,
+    });
+    expect(getTeamStats).toHaveBeenCalledTimes(1);
+    expect(vi.mocked(updateTeam).mock.invocationCallOrder[0]).toBeLessThan(
+      vi.mocked(getTeamStats).mock.invocationCallOrder[0],
+    );
+    expect(team.team_id).toBe(3);
+  });
+
+  it("should surface TeamNotFoundError for a missing team", async () => {
+    vi.mocked(updateTeam).mockRejectedValue(new TeamNotFoundError(99));
+
+    await expect(updateExistingTeam(99, { global_elo: 1100 })).rejects.toThrow(
+      TeamNotFoundError,
+    );
+    expect(getTeamStats).not.toHaveBeenCalled();
+  });
+});
+
+describe("deleteTeam", () => {
+  it("should delete without a prior existence lookup", async () => {
+    await deleteTeam(3);
+
+    expect(deleteTeamById).toHaveBeenCalledWith(3);
+    expect(getTeamStats).not.toHaveBeenCalled();
+  });
+
+  it("should surface TeamNotFoundError for a missing team", async () => {
+    vi.mocked(deleteTeamById).mockRejectedValue(new TeamNotFoundError(99));
+
+    await expect(deleteTeam(99)).rejects.toThrow(TeamNotFoundError);
+  });
+});
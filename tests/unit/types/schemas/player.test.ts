@@ -1,7 +1,9 @@
 import { describe, expect, it } from "vitest";
 import {
+  MAX_ELO,
   PlayerCreateSchema,
   PlayerResponseSchema,
+  PlayerUpdateSchema,
 } from "@/lib/types/schemas/player";
 
 describe("PlayerCreateSchema", () => {
@@ -32,6 +34,29 @@ describe("PlayerCreateSchema", () => {
 
     expect(result.success).toBe(false);
   });
+
+  it("should reject an ELO above the history column range", () => {
+    const result = PlayerCreateSchema.safeParse({
+      name: "John Doe",
+      global_elo: MAX_ELO + 1,
+    });
+
+    expect(result.success).toBe(false);
+  });
+});
+
+describe("PlayerUpdateSchema", () => {
+  it("should accept an ELO at the history column limit", () => {
+    const result = PlayerUpdateSchema.safeParse({ global_elo: MAX_ELO });
+
+    expect(result.success).toBe(true);
+  });
+
+  it("should reject an ELO above the history column range", () => {
+    const result = PlayerUpdateSchema.safeParse({ global_elo: MAX_ELO + 1 });
+
+    expect(result.success).toBe(false);
+  });
 });
 
 describe("PlayerResponseSchema", () => {
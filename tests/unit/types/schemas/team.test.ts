@@ -1,5 +1,6 @@
 import { describe, expect, it } from "vitest";
-import { TeamCreateSchema } from "@/lib/types/schemas/team";
+import { MAX_ELO } from "@/lib/types/schemas/player";
+import { TeamCreateSchema, TeamUpdateSchema } from "@/lib/types/schemas/team";
 
 describe("TeamCreateSchema", () => {
   it("should normalize player IDs to canonical order (lower first)", () => {
@@ -62,4 +63,22 @@ describe("TeamCreateSchema", () => {
 
     expect(result.success).toBe(false);
   });
+
+  it("should reject an ELO above the history column range", () => {
+    const result = TeamCreateSchema.safeParse({
+      player1_id: 1,
+      player2_id: 2,
+      global_elo: MAX_ELO + 1,
+    });
+
+    expect(result.success).toBe(false);
+  });
+});
+
+describe("TeamUpdateSchema", () => {
+  it("should reject an ELO above the history column range", () => {
+    const result = TeamUpdateSchema.safeParse({ global_elo: MAX_ELO + 1 });
+
+    expect(result.success).toBe(false);
+  });
 });